@@ -20,148 +20,123 @@ Usage:
     python3 src/modules/custom_source_manager.py document MySource
 """
 
+import io
+import re
 import sys
+import string
 import argparse
+import py_compile
+import functools
 from pathlib import Path
 from datetime import datetime
 
 
-class CustomSourceManager:
-    """
-    Manager for custom source handlers.
-    
-    Provides utilities to:
-    - Create new custom source handlers from templates
-    - Register custom sources in the SmartScraper system
-    - Test custom source handlers
-    - Document extraction patterns
-    """
-    
-    def __init__(self, base_path: Path):
-        self.base_path = Path(base_path)
-        self.sources_dir = self.base_path / 'src' / 'modules' / 'smart_scraper' / 'sources'
-        self.custom_sources_dir = self.sources_dir / 'custom'
-        self.templates_dir = self.base_path / 'docs' / 'source_templates'
-        
-        # Ensure directories exist
-        self.custom_sources_dir.mkdir(parents=True, exist_ok=True)
-        self.templates_dir.mkdir(parents=True, exist_ok=True)
-    
-    def create_source(self, name: str, url: str, source_type: str = 'html',
-                     location_strategy: str = 'detail_page') -> Path:
-        """
-        Create a new custom source handler from template.
-        
-        Args:
-            name: Source name (e.g., "MyNewsSource")
-            url: Base URL for the source
-            source_type: Type of source ('html', 'rss', 'api')
-            location_strategy: How to extract locations:
-                - 'detail_page': Follow links to detail pages to extract location
-                - 'listing_page': Extract location from listing page
-                - 'api_field': Extract from API response fields
-                - 'geocode': Use geocoding service with address text
-        
-        Returns:
-            Path to created source file
-        """
-        print(f"Creating custom source handler: {name}")
-        
-        # Generate filename
-        filename = self._to_snake_case(name) + '.py'
-        filepath = self.custom_sources_dir / filename
-        
-        if filepath.exists():
-            response = input(f"Source {name} already exists. Overwrite? (y/N): ")
-            if response.lower() != 'y':
-                print("Cancelled.")
-                return filepath
-        
-        # Generate source code from template
-        source_code = self._generate_source_code(name, url, source_type, location_strategy)
-        
-        # Write to file
-        with open(filepath, 'w') as f:
-            f.write(source_code)
-        
-        print(f"✓ Created source handler: {filepath}")
-        
-        # Update __init__.py to include new source
-        self._register_source(name, filename)
-        
-        # Create documentation
-        self._create_documentation(name, url, source_type, location_strategy)
-        
-        print(f"\n{'='*60}")
-        print("Next steps:")
-        print(f"1. Edit {filepath}")
-        print(f"2. Customize the extraction methods for your source")
-        print(f"3. Test with: python3 src/modules/custom_source_manager.py test {name}")
-        print(f"4. Add to config.json with type: '{self._to_snake_case(name)}'")
-        print(f"{'='*60}")
-        
-        return filepath
-    
-    def _generate_source_code(self, name: str, url: str, source_type: str,
-                             location_strategy: str) -> str:
-        """Generate source handler code from template."""
-        class_name = self._to_pascal_case(name) + 'Source'
-        
-        # Select template based on location strategy
-        if location_strategy == 'detail_page':
-            template = self._get_detail_page_template(class_name, name, url)
-        elif location_strategy == 'listing_page':
-            template = self._get_listing_page_template(class_name, name, url)
-        elif location_strategy == 'api_field':
-            template = self._get_api_template(class_name, name, url)
-        else:
-            template = self._get_basic_template(class_name, name, url)
-        
-        return template
-    
-    def _get_detail_page_template(self, class_name: str, name: str, url: str) -> str:
-        """Template for sources that need detail page scraping (like Frankenpost)."""
-        return f'''"""Custom source handler for {name}."""
+# Name conversion patterns (compiled once, shared by all conversions)
+# Snake case: non-word characters and lower→upper boundaries become "_"
+_SNAKE_RE = re.compile(r'[^\w]|(?<=[a-z])(?=[A-Z])')
+# Pascal case: split on spaces, underscores, hyphens
+_PASCAL_SPLIT_RE = re.compile(r'[\s_-]+')
+
+
+# Source handler templates, parsed once at import and filled per source
+# with string.Template placeholders: $name, $url, $class_name, $snake_name
+# (a literal dollar sign in generated code must be written as $$)
+_DETAIL_PAGE_TEMPLATE = string.Template('''"""Custom source handler for $name."""
 
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
 from urllib.parse import urljoin
 import re
+import json
+from importlib.util import find_spec
 from ...base import BaseSource, SourceOptions
 
-try:
-    import requests
-    from bs4 import BeautifulSoup
-    SCRAPING_AVAILABLE = True
-except ImportError:
-    SCRAPING_AVAILABLE = False
+# requests/BeautifulSoup are imported on the first scrape() call, so a
+# source that is disabled in config.json adds no import cost at startup
+SCRAPING_AVAILABLE = bool(find_spec('requests') and find_spec('bs4'))
+_REQUESTS = None
+_BS = None
+
 
+def _import_scraping_libs():
+    """Import requests and BeautifulSoup on first use."""
+    global _REQUESTS, _BS
+    if _REQUESTS is None:
+        import requests
+        from bs4 import BeautifulSoup
+        _REQUESTS, _BS = requests, BeautifulSoup
+
+
+# Date formats as one alternation so the text is scanned only once
+# TODO: Add date patterns specific to your source (one named group each)
+_DATE_RE = re.compile(
+    r'(?P<DMY>(\\d{1,2})\\.(\\d{1,2})\\.(\\d{4}))'   # DD.MM.YYYY
+    r'|(?P<YMD>(\\d{4})-(\\d{2})-(\\d{2}))'          # YYYY-MM-DD
+    r'|(?P<MDY>(\\d{1,2})/(\\d{1,2})/(\\d{4}))'      # MM/DD/YYYY
+)
+
+# Location labels, compiled once (keyword, case-insensitive pattern)
+# TODO: Add keywords specific to your source
+_LOCATION_LABELS = [
+    (keyword, re.compile(keyword, re.IGNORECASE))
+    for keyword in [
+        'Ort:', 'Veranstaltungsort:', 'Location:', 'Adresse:',
+        'Venue:', 'Place:', 'Address:', 'Where:'
+    ]
+]
 
-class {class_name}(BaseSource):
+# German address pattern: Street Number, ZIP City
+# TODO: Adjust pattern for your region/country
+_ADDRESS_RE = re.compile(
+    r'([A-ZÄÖÜ][a-zäöüß\\-\\s\\.]+\\s+\\d+[a-z]?\\s*,\\s*\\d{5}\\s+[A-ZÄÖÜ][a-zäöüß\\-\\s]+)'
+)
+
+
+def _find_event(data: Any) -> Dict[str, Any]:
+    """Return the first schema.org Event (or subtype) in parsed JSON-LD."""
+    if isinstance(data, list):
+        for item in data:
+            event = _find_event(item)
+            if event:
+                return event
+    elif isinstance(data, dict):
+        types = data.get('@type')
+        types = types if isinstance(types, list) else [types]
+        if any(isinstance(t, str) and t.endswith('Event') for t in types):
+            return data
+        return _find_event(data.get('@graph'))
+    return {}
+
+
+class $class_name(BaseSource):
     """
-    Custom scraper for {name}.
+    Custom scraper for $name.
     
     This source requires two-step scraping:
     1. List page: Get event titles, dates, and detail URLs
     2. Detail pages: Extract actual venue location information
     
     Usage in config.json:
-    {{
-        "name": "{name}",
-        "url": "{url}",
-        "type": "{self._to_snake_case(name)}",
+    {
+        "name": "$name",
+        "url": "$url",
+        "type": "$snake_name",
         "enabled": true,
-        "options": {{
+        "options": {
             "category": "community",
-            "default_location": {{
+            "default_location": {
                 "name": "Default City",
                 "lat": 50.0,
                 "lon": 11.0
-            }}
-        }}
-    }}
+            }
+        }
+    }
     """
     
+    # Fixed attribute layout (no per-instance __dict__). Add any new
+    # instance attribute you assign in this class to __slots__.
+    __slots__ = ('available', 'session')
+    
     def __init__(self, source_config: Dict[str, Any], options: SourceOptions,
                  base_path=None, ai_providers=None):
         super().__init__(
@@ -171,42 +146,49 @@ class {class_name}(BaseSource):
             ai_providers=ai_providers
         )
         self.available = SCRAPING_AVAILABLE
-        
-        if self.available:
-            self.session = requests.Session()
-            self.session.headers.update({{
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }})
+        self.session = None  # Created on first scrape()
     
     def scrape(self) -> List[Dict[str, Any]]:
-        """Scrape events from {name} with location extraction."""
+        """Scrape events from $name with location extraction."""
         if not self.available:
             print("  ⚠ Requests/BeautifulSoup not available")
             return []
         
+        _import_scraping_libs()
+        if self.session is None:
+            self.session = _REQUESTS.Session()
+            self.session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            })
+        
         events = []
+        progress = []  # Per-event status lines, printed as one batch
         try:
             # Step 1: Get list of events from main page
             response = self.session.get(self.url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'lxml')
+            soup = _BS(response.content, 'lxml')
             
             # Extract basic event info from listing
             event_links = self._extract_event_links(soup)
-            print(f"    Found {{len(event_links)}} event links")
+            print(f"    Found {len(event_links)} event links")
             
             # Step 2: Fetch each detail page to get location
+            total = min(len(event_links), 20)
             for i, (title, detail_url, date_text) in enumerate(event_links[:20], 1):
                 try:
                     event = self._scrape_detail_page(title, detail_url, date_text)
                     if event and not self.filter_event(event):
                         events.append(event)
-                        print(f"    [{{i}}/{{min(len(event_links), 20)}}] ✓ {{title[:50]}}")
+                        progress.append(f"    [{i}/{total}] ✓ {title[:50]}")
                 except Exception as e:
-                    print(f"    [{{i}}/{{min(len(event_links), 20)}}] ✗ Error: {{str(e)[:50]}}")
+                    progress.append(f"    [{i}/{total}] ✗ Error: {str(e)[:50]}")
                     
         except Exception as e:
-            print(f"    {name} scraping error: {{str(e)}}")
+            print(f"    $name scraping error: {str(e)}")
+        
+        if progress:
+            print("\\n".join(progress))
         
         return events
     
@@ -260,6 +242,10 @@ class {class_name}(BaseSource):
                     date_text = elem.get_text()
                     
                     event_links.append((title, detail_url, date_text))
+                    # Only the first 20 links are scraped: stop once that
+                    # many usable links were found
+                    if len(event_links) >= 20:
+                        break
                 
                 if event_links:
                     break  # Found events with this selector
@@ -280,19 +266,24 @@ class {class_name}(BaseSource):
         """
         response = self.session.get(url, timeout=10)
         response.raise_for_status()
-        soup = BeautifulSoup(response.content, 'lxml')
+        soup = _BS(response.content, 'lxml')
+        
+        # Prefer embedded schema.org/Event JSON-LD, fall back to heuristics
+        json_ld = self._extract_json_ld_event(soup)
         
         # Extract location from detail page
-        location = self._extract_location_from_detail(soup)
+        location = (self._location_from_json_ld(json_ld)
+                    or self._extract_location_from_detail(soup))
         
         # Extract description
-        description = self._extract_description(soup)
+        description = (str(json_ld.get('description') or '').strip()[:500]
+                       or self._extract_description(soup))
         
         # Parse date
         start_time = self._extract_date(date_text)
         
-        return {{
-            'id': f"html_{{self.name.lower().replace(' ', '_')}}_{{hash(title + start_time)}}",
+        return {
+            'id': f"html_{self.name.lower().replace(' ', '_')}_{hash(title + start_time)}",
             'title': title[:200],
             'description': description,
             'location': location,
@@ -302,7 +293,46 @@ class {class_name}(BaseSource):
             'source': self.name,
             'scraped_at': datetime.now().isoformat(),
             'status': 'pending'
-        }}
+        }
+    
+    def _extract_json_ld_event(self, soup) -> Dict[str, Any]:
+        """
+        Extract the schema.org Event embedded as JSON-LD, if any.
+        
+        Many event pages embed venue name, coordinates and description in a
+        small <script type="application/ld+json"> block, which is far cheaper
+        to read than running the DOM heuristics below.
+        
+        Returns:
+            Event dict, or empty dict if the page has no usable JSON-LD
+        """
+        for script in soup.find_all('script', type='application/ld+json', limit=5):
+            try:
+                event = _find_event(json.loads(script.string or ''))
+            except ValueError:
+                continue
+            if event:
+                return event
+        return {}
+    
+    def _location_from_json_ld(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a location dict from a JSON-LD Event, or None if it has none."""
+        place = event.get('location')
+        if isinstance(place, list):
+            place = place[0] if place else None
+        if not isinstance(place, dict) or not place.get('name'):
+            return None
+        
+        geo = place.get('geo') or {}
+        try:
+            return {
+                'name': place['name'],
+                'lat': float(geo['latitude']),
+                'lon': float(geo['longitude'])
+            }
+        except (KeyError, TypeError, ValueError):
+            # Venue name without coordinates
+            return self._estimate_coordinates(place['name'])
     
     def _extract_location_from_detail(self, soup) -> Dict[str, Any]:
         """
@@ -321,15 +351,9 @@ class {class_name}(BaseSource):
         location_name = None
         full_address = None
         
-        # Strategy 1: Look for location-related labels
-        # TODO: Add keywords specific to your source
-        location_keywords = [
-            'Ort:', 'Veranstaltungsort:', 'Location:', 'Adresse:', 
-            'Venue:', 'Place:', 'Address:', 'Where:'
-        ]
-        
-        for keyword in location_keywords:
-            label = soup.find(string=re.compile(keyword, re.IGNORECASE))
+        # Strategy 1: Look for location-related labels (see _LOCATION_LABELS)
+        for keyword, label_pattern in _LOCATION_LABELS:
+            label = soup.find(string=label_pattern)
             if label and label.parent:
                 parent = label.parent
                 
@@ -348,16 +372,12 @@ class {class_name}(BaseSource):
                     location_name = parent_text
                     break
         
-        # Strategy 2: Look for address patterns
-        # TODO: Adjust pattern for your region/country
+        # Strategy 2: Look for address patterns (see _ADDRESS_RE)
         page_text = soup.get_text()
+        address_match = _ADDRESS_RE.search(page_text)
         
-        # German address pattern: Street Number, ZIP City
-        address_pattern = r'([A-ZÄÖÜ][a-zäöüß\\-\\s\\.]+\\s+\\d+[a-z]?\\s*,\\s*\\d{{5}}\\s+[A-ZÄÖÜ][a-zäöüß\\-\\s]+)'
-        addresses = re.findall(address_pattern, page_text)
-        
-        if addresses:
-            full_address = addresses[0].strip()
+        if address_match:
+            full_address = address_match.group(1).strip()
             if not location_name:
                 location_name = full_address
         
@@ -380,7 +400,7 @@ class {class_name}(BaseSource):
         if not location_name and not full_address:
             if self.options.default_location:
                 return self.options.default_location
-            return {{'name': 'Unknown Location', 'lat': 50.0, 'lon': 11.0}}
+            return {'name': 'Unknown Location', 'lat': 50.0, 'lon': 11.0}
         
         # Estimate coordinates based on location text
         return self._estimate_coordinates(location_name or full_address)
@@ -397,32 +417,32 @@ class {class_name}(BaseSource):
         - Mapbox Geocoding API
         """
         if not location_text:
-            return {{'name': 'Unknown', 'lat': 50.0, 'lon': 11.0}}
+            return {'name': 'Unknown', 'lat': 50.0, 'lon': 11.0}
         
         location_text_lower = location_text.lower()
         
         # TODO: Add known locations for your region
-        known_locations = {{
-            'example city': {{'lat': 50.0, 'lon': 11.0}},
+        known_locations = {
+            'example city': {'lat': 50.0, 'lon': 11.0},
             # Add more cities here:
-            # 'berlin': {{'lat': 52.5200, 'lon': 13.4050}},
-            # 'munich': {{'lat': 48.1351, 'lon': 11.5820}},
-        }}
+            # 'berlin': {'lat': 52.5200, 'lon': 13.4050},
+            # 'munich': {'lat': 48.1351, 'lon': 11.5820},
+        }
         
         for city, coords in known_locations.items():
             if city in location_text_lower:
-                return {{
+                return {
                     'name': location_text,
                     'lat': coords['lat'],
                     'lon': coords['lon']
-                }}
+                }
         
         # Default coordinates if city not recognized
-        return {{
+        return {
             'name': location_text,
             'lat': 50.0,
             'lon': 11.0
-        }}
+        }
     
     def _extract_description(self, soup) -> str:
         """
@@ -455,20 +475,15 @@ class {class_name}(BaseSource):
         """
         Extract date from text using patterns.
         
-        TODO: Add date patterns specific to your source!
+        TODO: Add date patterns specific to your source (see _DATE_RE)!
         """
-        patterns = [
-            (r'(\\d{{1,2}})\\.(\\d{{1,2}})\\.(\\d{{4}})', 'DMY'),  # DD.MM.YYYY
-            (r'(\\d{{4}})-(\\d{{2}})-(\\d{{2}})', 'YMD'),  # YYYY-MM-DD
-            (r'(\\d{{1,2}})/(\\d{{1,2}})/(\\d{{4}})', 'MDY'),  # MM/DD/YYYY
-        ]
-        
-        for pattern, format_type in patterns:
-            match = re.search(pattern, text)
-            if match:
-                date = self._parse_date_match(match.groups(), format_type)
-                if date:
-                    return date
+        for match in _DATE_RE.finditer(text):
+            # lastindex is the named format group; its three fields follow it
+            start = match.lastindex
+            groups = match.group(start + 1, start + 2, start + 3)
+            date = self._parse_date_match(groups, match.lastgroup)
+            if date:
+                return date
         
         # Default to next week if no date found
         return (datetime.now() + timedelta(days=7)).replace(hour=18, minute=0).isoformat()
@@ -488,41 +503,61 @@ class {class_name}(BaseSource):
             return date.isoformat()
         except ValueError:
             return None
-'''
-    
-    def _get_listing_page_template(self, class_name: str, name: str, url: str) -> str:
-        """Template for sources where location is on the listing page."""
-        return f'''"""Custom source handler for {name}."""
+''')
+
+
+_LISTING_PAGE_TEMPLATE = string.Template('''"""Custom source handler for $name."""
 
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
 import re
+from importlib.util import find_spec
 from ...base import BaseSource, SourceOptions
 
-try:
-    import requests
-    from bs4 import BeautifulSoup
-    SCRAPING_AVAILABLE = True
-except ImportError:
-    SCRAPING_AVAILABLE = False
+# requests/BeautifulSoup are imported on the first scrape() call, so a
+# source that is disabled in config.json adds no import cost at startup
+SCRAPING_AVAILABLE = bool(find_spec('requests') and find_spec('bs4'))
+_REQUESTS = None
+_BS = None
+
+
+def _import_scraping_libs():
+    """Import requests and BeautifulSoup on first use."""
+    global _REQUESTS, _BS
+    if _REQUESTS is None:
+        import requests
+        from bs4 import BeautifulSoup
+        _REQUESTS, _BS = requests, BeautifulSoup
+
 
+# Date formats as one alternation so the text is scanned only once
+# TODO: Add date patterns for your source (one named group each)
+_DATE_RE = re.compile(
+    r'(?P<DMY>(\\d{1,2})\\.(\\d{1,2})\\.(\\d{4}))'   # DD.MM.YYYY
+    r'|(?P<YMD>(\\d{4})-(\\d{2})-(\\d{2}))'          # YYYY-MM-DD
+)
 
-class {class_name}(BaseSource):
+
+class $class_name(BaseSource):
     """
-    Custom scraper for {name}.
+    Custom scraper for $name.
     
     This source extracts all information (including location) from the listing page.
     No need for detail page scraping.
     
     Usage in config.json:
-    {{
-        "name": "{name}",
-        "url": "{url}",
-        "type": "{self._to_snake_case(name)}",
+    {
+        "name": "$name",
+        "url": "$url",
+        "type": "$snake_name",
         "enabled": true
-    }}
+    }
     """
     
+    # Fixed attribute layout (no per-instance __dict__). Add any new
+    # instance attribute you assign in this class to __slots__.
+    __slots__ = ('available', 'session')
+    
     def __init__(self, source_config: Dict[str, Any], options: SourceOptions,
                  base_path=None, ai_providers=None):
         super().__init__(
@@ -532,29 +567,31 @@ class {class_name}(BaseSource):
             ai_providers=ai_providers
         )
         self.available = SCRAPING_AVAILABLE
-        
-        if self.available:
-            self.session = requests.Session()
-            self.session.headers.update({{
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }})
+        self.session = None  # Created on first scrape()
     
     def scrape(self) -> List[Dict[str, Any]]:
-        """Scrape events from {name}."""
+        """Scrape events from $name."""
         if not self.available:
             print("  ⚠ Requests/BeautifulSoup not available")
             return []
         
+        _import_scraping_libs()
+        if self.session is None:
+            self.session = _REQUESTS.Session()
+            self.session.headers.update({
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            })
+        
         events = []
         try:
             response = self.session.get(self.url, timeout=10)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'lxml')
+            soup = _BS(response.content, 'lxml')
             
             events = self._extract_events(soup)
             
         except Exception as e:
-            print(f"    {name} error: {{str(e)}}")
+            print(f"    $name error: {str(e)}")
         
         return events
     
@@ -572,10 +609,12 @@ class {class_name}(BaseSource):
         for selector in selectors:
             items = soup.select(selector)
             if items:
-                for item in items[:20]:  # Limit to 20
+                for item in items:
                     event = self._parse_event_element(item)
                     if event and not self.filter_event(event):
                         events.append(event)
+                        if len(events) >= 20:  # Limit to 20
+                            break
                 break
         
         return events
@@ -610,8 +649,8 @@ class {class_name}(BaseSource):
             if not title or title == 'Untitled':
                 return None
             
-            return {{
-                'id': f"html_{{self.name.lower().replace(' ', '_')}}_{{hash(title + start_time)}}",
+            return {
+                'id': f"html_{self.name.lower().replace(' ', '_')}_{hash(title + start_time)}",
                 'title': title[:200],
                 'description': description,
                 'location': location,
@@ -621,9 +660,9 @@ class {class_name}(BaseSource):
                 'source': self.name,
                 'scraped_at': datetime.now().isoformat(),
                 'status': 'pending'
-            }}
+            }
         except Exception as e:
-            print(f"      Error parsing element: {{str(e)}}")
+            print(f"      Error parsing element: {str(e)}")
             return None
     
     def _extract_location(self, element) -> Dict[str, Any]:
@@ -643,7 +682,7 @@ class {class_name}(BaseSource):
         if self.options.default_location:
             return self.options.default_location
         
-        return {{'name': 'Unknown', 'lat': 50.0, 'lon': 11.0}}
+        return {'name': 'Unknown', 'lat': 50.0, 'lon': 11.0}
     
     def _estimate_coordinates(self, location_text: str) -> Dict[str, Any]:
         """
@@ -652,72 +691,76 @@ class {class_name}(BaseSource):
         TODO: Add known locations for your region!
         """
         # Add your known locations here
-        known_locations = {{}}
+        known_locations = {}
         
         location_text_lower = location_text.lower()
         for city, coords in known_locations.items():
             if city in location_text_lower:
-                return {{
+                return {
                     'name': location_text,
                     'lat': coords['lat'],
                     'lon': coords['lon']
-                }}
+                }
         
-        return {{'name': location_text, 'lat': 50.0, 'lon': 11.0}}
+        return {'name': location_text, 'lat': 50.0, 'lon': 11.0}
     
     def _extract_date(self, text: str) -> str:
         """Extract date from text."""
-        # TODO: Add date patterns for your source
-        patterns = [
-            (r'(\\d{{1,2}})\\.(\\d{{1,2}})\\.(\\d{{4}})', 'DMY'),
-            (r'(\\d{{4}})-(\\d{{2}})-(\\d{{2}})', 'YMD'),
-        ]
-        
-        for pattern, format_type in patterns:
-            match = re.search(pattern, text)
-            if match:
-                try:
-                    if format_type == 'DMY':
-                        day, month, year = match.groups()
-                        date = datetime(int(year), int(month), int(day), 18, 0)
-                    else:
-                        year, month, day = match.groups()
-                        date = datetime(int(year), int(month), int(day), 18, 0)
-                    return date.isoformat()
-                except ValueError:
-                    pass
+        for match in _DATE_RE.finditer(text):
+            # lastindex is the named format group; its three fields follow it
+            start = match.lastindex
+            first, second, third = match.group(start + 1, start + 2, start + 3)
+            try:
+                if match.lastgroup == 'DMY':
+                    date = datetime(int(third), int(second), int(first), 18, 0)
+                else:
+                    date = datetime(int(first), int(second), int(third), 18, 0)
+                return date.isoformat()
+            except ValueError:
+                pass
         
         return (datetime.now() + timedelta(days=7)).replace(hour=18, minute=0).isoformat()
-'''
-    
-    def _get_api_template(self, class_name: str, name: str, url: str) -> str:
-        """Template for API sources."""
-        return f'''"""Custom source handler for {name} API."""
+''')
+
+
+_API_TEMPLATE = string.Template('''"""Custom source handler for $name API."""
 
 from typing import Dict, Any, List
 from datetime import datetime
+from importlib.util import find_spec
 from ...base import BaseSource, SourceOptions
 
-try:
-    import requests
-    SCRAPING_AVAILABLE = True
-except ImportError:
-    SCRAPING_AVAILABLE = False
+# requests is imported on the first scrape() call, so a source that is
+# disabled in config.json adds no import cost at startup
+SCRAPING_AVAILABLE = find_spec('requests') is not None
+_REQUESTS = None
+
+
+def _import_scraping_libs():
+    """Import requests on first use."""
+    global _REQUESTS
+    if _REQUESTS is None:
+        import requests
+        _REQUESTS = requests
 
 
-class {class_name}(BaseSource):
+class $class_name(BaseSource):
     """
-    Custom scraper for {name} API.
+    Custom scraper for $name API.
     
     Usage in config.json:
-    {{
-        "name": "{name}",
-        "url": "{url}",
-        "type": "{self._to_snake_case(name)}",
+    {
+        "name": "$name",
+        "url": "$url",
+        "type": "$snake_name",
         "enabled": true
-    }}
+    }
     """
     
+    # Fixed attribute layout (no per-instance __dict__). Add any new
+    # instance attribute you assign in this class to __slots__.
+    __slots__ = ('available', 'session')
+    
     def __init__(self, source_config: Dict[str, Any], options: SourceOptions,
                  base_path=None, ai_providers=None):
         super().__init__(
@@ -727,21 +770,23 @@ class {class_name}(BaseSource):
             ai_providers=ai_providers
         )
         self.available = SCRAPING_AVAILABLE
-        
-        if self.available:
-            self.session = requests.Session()
-            # TODO: Add API authentication headers if needed
-            self.session.headers.update({{
-                'Accept': 'application/json',
-                'User-Agent': 'Mozilla/5.0'
-            }})
+        self.session = None  # Created on first scrape()
     
     def scrape(self) -> List[Dict[str, Any]]:
-        """Scrape events from {name} API."""
+        """Scrape events from $name API."""
         if not self.available:
             print("  ⚠ Requests library not available")
             return []
         
+        _import_scraping_libs()
+        if self.session is None:
+            self.session = _REQUESTS.Session()
+            # TODO: Add API authentication headers if needed
+            self.session.headers.update({
+                'Accept': 'application/json',
+                'User-Agent': 'Mozilla/5.0'
+            })
+        
         events = []
         try:
             response = self.session.get(self.url, timeout=10)
@@ -752,7 +797,7 @@ class {class_name}(BaseSource):
             events = self._parse_api_response(data)
             
         except Exception as e:
-            print(f"    {name} API error: {{str(e)}}")
+            print(f"    $name API error: {str(e)}")
         
         return events
     
@@ -790,8 +835,8 @@ class {class_name}(BaseSource):
             # Extract location
             location = self._extract_location_from_api(item)
             
-            return {{
-                'id': f"api_{{self.name.lower().replace(' ', '_')}}_{{item.get('id', hash(title))}}",
+            return {
+                'id': f"api_{self.name.lower().replace(' ', '_')}_{item.get('id', hash(title))}",
                 'title': title[:200],
                 'description': description,
                 'location': location,
@@ -801,9 +846,9 @@ class {class_name}(BaseSource):
                 'source': self.name,
                 'scraped_at': datetime.now().isoformat(),
                 'status': 'pending'
-            }}
+            }
         except Exception as e:
-            print(f"      Error parsing API item: {{str(e)}}")
+            print(f"      Error parsing API item: {str(e)}")
             return None
     
     def _extract_location_from_api(self, item: Dict[str, Any]) -> Dict[str, Any]:
@@ -815,26 +860,169 @@ class {class_name}(BaseSource):
         # Check if location is a nested object
         if 'location' in item and isinstance(item['location'], dict):
             loc = item['location']
-            return {{
+            return {
                 'name': loc.get('name', 'Unknown'),
                 'lat': loc.get('lat') or loc.get('latitude', 50.0),
                 'lon': loc.get('lon') or loc.get('longitude', 11.0)
-            }}
+            }
         
         # Check for separate fields
         if 'venue' in item:
-            return {{
+            return {
                 'name': item['venue'],
                 'lat': item.get('latitude', 50.0),
                 'lon': item.get('longitude', 11.0)
-            }}
+            }
         
         # Fallback
         if self.options.default_location:
             return self.options.default_location
         
-        return {{'name': 'Unknown', 'lat': 50.0, 'lon': 11.0}}
-'''
+        return {'name': 'Unknown', 'lat': 50.0, 'lon': 11.0}
+''')
+
+
+class CustomSourceManager:
+    """
+    Manager for custom source handlers.
+    
+    Provides utilities to:
+    - Create new custom source handlers from templates
+    - Register custom sources in the SmartScraper system
+    - Test custom source handlers
+    - Document extraction patterns
+    """
+    
+    # Loaded source modules keyed by file path: (mtime, module). Shared by
+    # all managers so repeated tests in one process skip re-executing files
+    _module_cache = {}
+    
+    def __init__(self, base_path: Path):
+        self.base_path = Path(base_path)
+        self.sources_dir = self.base_path / 'src' / 'modules' / 'smart_scraper' / 'sources'
+        self.custom_sources_dir = self.sources_dir / 'custom'
+        self.templates_dir = self.base_path / 'docs' / 'source_templates'
+        
+        # Lowercased smart_scraper/core.py, loaded on first registration check
+        self._core_text_lower = None
+        
+        # Ensure directories exist
+        self.custom_sources_dir.mkdir(parents=True, exist_ok=True)
+        self.templates_dir.mkdir(parents=True, exist_ok=True)
+    
+    def create_source(self, name: str, url: str, source_type: str = 'html',
+                     location_strategy: str = 'detail_page') -> Path:
+        """
+        Create a new custom source handler from template.
+        
+        Args:
+            name: Source name (e.g., "MyNewsSource")
+            url: Base URL for the source
+            source_type: Type of source ('html', 'rss', 'api')
+            location_strategy: How to extract locations:
+                - 'detail_page': Follow links to detail pages to extract location
+                - 'listing_page': Extract location from listing page
+                - 'api_field': Extract from API response fields
+                - 'geocode': Use geocoding service with address text
+        
+        Returns:
+            Path to created source file
+        """
+        print(f"Creating custom source handler: {name}")
+        
+        # Generate filename
+        filename = self._to_snake_case(name) + '.py'
+        filepath = self.custom_sources_dir / filename
+        
+        if filepath.exists():
+            response = input(f"Source {name} already exists. Overwrite? (y/N): ")
+            if response.lower() != 'y':
+                print("Cancelled.")
+                return filepath
+        
+        # Generate source code from template
+        source_code = self._generate_source_code(name, url, source_type, location_strategy)
+        
+        # Write to file
+        with open(filepath, 'w') as f:
+            f.write(source_code)
+        
+        print(f"✓ Created source handler: {filepath}")
+        
+        # Byte-compile now so the first import (e.g. `test`) skips parsing;
+        # the .pyc lands in __pycache__ where the import system looks for it
+        try:
+            py_compile.compile(str(filepath), doraise=True)
+        except py_compile.PyCompileError as e:
+            print(f"⚠ Generated source does not compile: {e.msg}")
+        
+        # Update __init__.py to include new source
+        self._register_source(name, filename)
+        
+        # Create documentation
+        self._create_documentation(name, url, source_type, location_strategy)
+        
+        sys.stdout.write(
+            f"\n{'='*60}\n"
+            "Next steps:\n"
+            f"1. Edit {filepath}\n"
+            "2. Customize the extraction methods for your source\n"
+            f"3. Test with: python3 src/modules/custom_source_manager.py test {name}\n"
+            f"4. Add to config.json with type: '{self._to_snake_case(name)}'\n"
+            f"{'='*60}\n"
+        )
+        
+        return filepath
+    
+    def _generate_source_code(self, name: str, url: str, source_type: str,
+                             location_strategy: str) -> str:
+        """
+        Generate source handler code from template.
+        
+        Generated classes declare __slots__ on top of BaseSource's, so
+        instances have no __dict__: any attribute added to a template must
+        also be listed in that template's __slots__.
+        """
+        class_name = self._to_pascal_case(name) + 'Source'
+        
+        # Select template based on location strategy
+        if location_strategy == 'detail_page':
+            template = self._get_detail_page_template(class_name, name, url)
+        elif location_strategy == 'listing_page':
+            template = self._get_listing_page_template(class_name, name, url)
+        elif location_strategy == 'api_field':
+            template = self._get_api_template(class_name, name, url)
+        else:
+            template = self._get_basic_template(class_name, name, url)
+        
+        return template
+    
+    def _get_detail_page_template(self, class_name: str, name: str, url: str) -> str:
+        """Template for sources that need detail page scraping (like Frankenpost)."""
+        return _DETAIL_PAGE_TEMPLATE.substitute(
+            class_name=class_name,
+            name=name,
+            url=url,
+            snake_name=self._to_snake_case(name),
+        )
+    
+    def _get_listing_page_template(self, class_name: str, name: str, url: str) -> str:
+        """Template for sources where location is on the listing page."""
+        return _LISTING_PAGE_TEMPLATE.substitute(
+            class_name=class_name,
+            name=name,
+            url=url,
+            snake_name=self._to_snake_case(name),
+        )
+    
+    def _get_api_template(self, class_name: str, name: str, url: str) -> str:
+        """Template for API sources."""
+        return _API_TEMPLATE.substitute(
+            class_name=class_name,
+            name=name,
+            url=url,
+            snake_name=self._to_snake_case(name),
+        )
     
     def _get_basic_template(self, class_name: str, name: str, url: str) -> str:
         """Basic template for simple sources."""
@@ -844,21 +1032,18 @@ class {class_name}(BaseSource):
         """Register source in __init__.py."""
         init_file = self.custom_sources_dir / '__init__.py'
         
-        # Create __init__.py if it doesn't exist
-        if not init_file.exists():
-            with open(init_file, 'w') as f:
-                f.write('"""Custom source handlers."""\n\n')
+        # Start a new __init__.py if it doesn't exist
+        if init_file.exists():
+            content = init_file.read_text()
+        else:
+            content = '"""Custom source handlers."""\n\n'
         
-        # Add import statement
+        # Add import statement (one write for both cases)
         module_name = filename.replace('.py', '')
         import_line = f"from . import {module_name}\n"
         
-        with open(init_file, 'r') as f:
-            content = f.read()
-        
         if import_line not in content:
-            with open(init_file, 'a') as f:
-                f.write(import_line)
+            init_file.write_text(content + import_line)
             print(f"✓ Registered {name} in __init__.py")
     
     def _create_documentation(self, name: str, url: str, source_type: str,
@@ -989,37 +1174,35 @@ See the source file for detailed TODO comments marking customization points.
         print("Custom Source Handlers:")
         print("="*60)
         
-        sources = list(self.custom_sources_dir.glob('*.py'))
-        sources = [s for s in sources if s.name != '__init__.py']
+        sources = sorted(s for s in self.custom_sources_dir.glob('*.py')
+                         if s.name != '__init__.py')
         
         if not sources:
             print("No custom sources found.")
             print(f"Create one with: python3 {sys.argv[0]} create SourceName --url URL")
             return
         
+        # Collect the whole listing and write it once instead of ~4 prints per source
+        out = io.StringIO()
         for i, source_file in enumerate(sources, 1):
             name = source_file.stem
-            print(f"{i}. {name}")
-            print(f"   File: {source_file}")
             
             # Check if registered in core
-            registered = self._check_if_registered(name)
-            if registered:
-                print(f"   Status: ✓ Registered in SmartScraper")
+            if self._check_if_registered(name):
+                status = "✓ Registered in SmartScraper"
             else:
-                print(f"   Status: ⚠ Not registered (add to core.py)")
-            print()
+                status = "⚠ Not registered (add to core.py)"
+            out.write(f"{i}. {name}\n   File: {source_file}\n   Status: {status}\n\n")
+        sys.stdout.write(out.getvalue())
     
     def _check_if_registered(self, name: str) -> bool:
         """Check if source is registered in SmartScraper core."""
-        core_file = self.base_path / 'src' / 'modules' / 'smart_scraper' / 'core.py'
-        if not core_file.exists():
-            return False
+        # core.py is read once per manager, not once per listed source
+        if self._core_text_lower is None:
+            core_file = self.base_path / 'src' / 'modules' / 'smart_scraper' / 'core.py'
+            self._core_text_lower = core_file.read_text().lower() if core_file.exists() else ''
         
-        with open(core_file, 'r') as f:
-            content = f.read()
-        
-        return name.lower() in content.lower()
+        return name.lower() in self._core_text_lower
     
     def test_source(self, name: str):
         """Test a custom source handler."""
@@ -1034,10 +1217,7 @@ See the source file for detailed TODO comments marking customization points.
         
         # Try to import and test
         try:
-            import importlib.util
-            spec = importlib.util.spec_from_file_location(name, source_file)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            module = self._load_source_module(name, source_file)
             
             print(f"✓ Source module loaded successfully")
             
@@ -1075,20 +1255,32 @@ See the source file for detailed TODO comments marking customization points.
             import traceback
             traceback.print_exc()
     
-    def _to_snake_case(self, name: str) -> str:
-        """Convert name to snake_case."""
-        # Replace spaces and special chars with underscores
-        name = re.sub(r'[^\w]', '_', name)
-        # Insert underscore before uppercase letters
-        name = re.sub(r'([a-z])([A-Z])', r'\1_\2', name)
-        return name.lower()
+    def _load_source_module(self, name: str, source_file: Path):
+        """Import a source file, reusing the module while the file is unchanged."""
+        mtime = source_file.stat().st_mtime
+        cached = self._module_cache.get(source_file)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        import importlib.util
+        spec = importlib.util.spec_from_file_location(name, source_file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        
+        self._module_cache[source_file] = (mtime, module)
+        return module
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _to_snake_case(name: str) -> str:
+        """Convert name to snake_case (single regex pass, memoized)."""
+        return _SNAKE_RE.sub('_', name).lower()
     
-    def _to_pascal_case(self, name: str) -> str:
-        """Convert name to PascalCase."""
-        # Split on spaces, underscores, hyphens
-        parts = re.split(r'[\s_-]+', name)
-        # Capitalize each part
-        return ''.join(p.capitalize() for p in parts if p)
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _to_pascal_case(name: str) -> str:
+        """Convert name to PascalCase (memoized)."""
+        return ''.join(p.capitalize() for p in _PASCAL_SPLIT_RE.split(name) if p)
 
 
 def main():
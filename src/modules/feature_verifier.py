@@ -11,14 +11,72 @@ Supports three execution modes:
 - Daemon Mode: Continuous monitoring with file watching (--daemon)
 """
 
+import io
 import json
+import mmap
 import os
 import re
 import sys
 import time
 import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+
+# Source files above this size are mapped instead of read into memory
+MMAP_THRESHOLD = 64 * 1024
+
+# Backreferences change meaning once a pattern is embedded in a larger regex
+BACKREFERENCE_PATTERN = re.compile(r'\\[1-9]|\(\?P=')
+
+# Patterns without any of these characters are plain text, searched with find()
+REGEX_METACHAR_PATTERN = re.compile(r'[.^$*+?()\[\]{}|\\]')
+
+
+def _longest_literal_run(items):
+    """Longest run of consecutive literal bytes in a parsed regex sequence"""
+    longest = run = b''
+    for op, value in items:
+        if op is sre_parse.LITERAL:
+            run += bytes((value,))
+            if len(run) > len(longest):
+                longest = run
+        else:
+            run = b''
+    return longest
+
+
+def required_literals(pattern_str):
+    """
+    Byte strings of which any match of the pattern must contain at least
+    one, one per top-level alternative (empty tuple if there are none).
+    
+    Used as a substring prescreen: if none of them occurs in a file, the
+    regex can't match there and doesn't need to run. Only literals directly
+    in a branch count (not ones inside groups, classes or repeats), and
+    case-insensitive patterns get no prescreen.
+    """
+    try:
+        parsed = sre_parse.parse(pattern_str.encode('utf-8'))
+    except Exception:
+        return ()  # Invalid patterns are reported by the search itself
+    if parsed.state.flags & re.IGNORECASE:
+        return ()
+    
+    items = list(parsed)
+    if len(items) == 1 and items[0][0] is sre_parse.BRANCH:
+        branches = items[0][1][1]
+    else:
+        branches = [items]
+    literals = tuple(_longest_literal_run(branch) for branch in branches)
+    return literals if all(literals) else ()
+
 
 class FeatureVerifier:
     """Verifies presence of documented features in codebase"""
@@ -26,8 +84,10 @@ class FeatureVerifier:
     # Default value for 'implemented' field in features.json
     DEFAULT_IMPLEMENTED = True
     
-    def __init__(self, repo_root=None, verbose=False):
+    def __init__(self, repo_root=None, verbose=False, fail_fast=False):
         self.verbose = verbose
+        # Stop at the first failing check/feature (pass/fail is all CI needs)
+        self.fail_fast = fail_fast
         self.repo_root = Path(repo_root) if repo_root else Path.cwd()
         self.features_file = self.repo_root / "features.json"
         self.results = {
@@ -37,6 +97,20 @@ class FeatureVerifier:
             "skipped": 0,
             "features": []
         }
+        # ('literal', text) or ('regex', compiled) by pattern string, so
+        # shared patterns compile once
+        self._pattern_cache = {}
+        # Prescreen literals (see required_literals) by pattern string
+        self._literal_cache = {}
+        # File contents (raw bytes, or an mmap for large files) by path,
+        # read once per verify_all/verify_feature call; the lock guards
+        # fills from the verification thread pool
+        self._file_cache = {}
+        self._file_cache_lock = threading.Lock()
+        # Alternations of the patterns one feature checks in the same file
+        self._combined_cache = {}
+        # Nested key paths of each config file, as tuples, per run
+        self._config_cache = {}
     
     def log(self, message, level="INFO"):
         """Log message if verbose mode is enabled"""
@@ -65,6 +139,63 @@ class FeatureVerifier:
         missing = [f for f in feature['files'] if not self._check_single_file(f)]
         return len(missing) == 0, missing
     
+    def _get_file_content(self, file_path):
+        """Read a source file as bytes, reusing the content for further patterns"""
+        content = self._file_cache.get(file_path)
+        if content is None:
+            full_path = self.repo_root / file_path
+            if full_path.stat().st_size > MMAP_THRESHOLD:
+                # Scanned straight from the page cache, without a copy
+                with open(full_path, 'rb') as f:
+                    content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                content = full_path.read_bytes()
+            
+            # Files are read outside the lock; if another thread cached the
+            # same file meanwhile, use its copy and unmap ours
+            with self._file_cache_lock:
+                cached = self._file_cache.setdefault(file_path, content)
+            if cached is not content:
+                if isinstance(content, mmap.mmap):
+                    content.close()
+                content = cached
+        return content
+    
+    def _clear_file_cache(self):
+        """Drop cached file contents, unmapping large files"""
+        with self._file_cache_lock:
+            contents = list(self._file_cache.values())
+            self._file_cache.clear()
+        for content in contents:
+            if isinstance(content, mmap.mmap):
+                content.close()
+    
+    def _release_caches(self):
+        """Drop the per-run file and config caches after a verification"""
+        self._clear_file_cache()
+        self._config_cache.clear()
+    
+    def _may_match(self, pattern_str, content):
+        """Whether content has one of the literals any match of the pattern needs"""
+        literals = self._literal_cache.get(pattern_str)
+        if literals is None:
+            literals = self._literal_cache[pattern_str] = required_literals(pattern_str)
+        # find(), since 'in' on an mmap looks for single bytes, not substrings
+        return not literals or any(content.find(literal) != -1 for literal in literals)
+    
+    def _get_pattern(self, pattern_str):
+        """Cached ('literal', bytes) or ('regex', compiled) entry for a pattern"""
+        entry = self._pattern_cache.get(pattern_str)
+        if entry is None:
+            # Patterns run on the raw UTF-8 bytes (no decode pass)
+            pattern_bytes = pattern_str.encode('utf-8')
+            if REGEX_METACHAR_PATTERN.search(pattern_str):
+                entry = ('regex', re.compile(pattern_bytes))
+            else:
+                entry = ('literal', pattern_bytes)
+            self._pattern_cache[pattern_str] = entry
+        return entry
+    
     def _search_pattern_in_file(self, file_path, pattern_str):
         """Search for a pattern in a file"""
         full_path = self.repo_root / file_path
@@ -72,28 +203,95 @@ class FeatureVerifier:
             return False, "file not found"
         
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._get_file_content(file_path)
             
-            pattern = re.compile(pattern_str)
-            if pattern.search(content):
+            kind, pattern = self._get_pattern(pattern_str)
+            if kind == 'literal':
+                found = content.find(pattern) != -1
+            else:
+                found = self._may_match(pattern_str, content) and pattern.search(content) is not None
+            if found:
                 return True, None
             return False, "pattern not found"
         except Exception as e:
             return False, f"error reading file: {e}"
     
+    def _get_combined_pattern(self, patterns):
+        """Compile patterns into one alternation (None if they can't be combined)"""
+        key = tuple(patterns)
+        if key not in self._combined_cache:
+            combined = None
+            if not any(BACKREFERENCE_PATTERN.search(p) for p in patterns):
+                try:
+                    combined = re.compile('|'.join(
+                        f'(?P<p{i}>{p})' for i, p in enumerate(patterns)
+                    ).encode('utf-8'))
+                except re.error:
+                    pass  # e.g. inline flags; search individually
+            self._combined_cache[key] = combined
+        return self._combined_cache[key]
+    
+    def _search_patterns_in_file(self, file_path, patterns):
+        """Search for several patterns in a file, scanning it once if possible"""
+        if len(patterns) == 1:
+            return [self._search_pattern_in_file(file_path, patterns[0])]
+        
+        found = set()
+        ruled_out = set()
+        content = None
+        if (self.repo_root / file_path).exists():
+            try:
+                content = self._get_file_content(file_path)
+            except Exception:
+                pass  # Reported by the individual search below
+        if content is not None:
+            # Patterns whose required literals are absent can't match, so
+            # only the others go into the combined scan
+            ruled_out = {i for i, p in enumerate(patterns) if not self._may_match(p, content)}
+            candidates = [i for i in range(len(patterns)) if i not in ruled_out]
+            # For plain text the required literal is the whole pattern, so
+            # passing the prescreen means it was found
+            found = {i for i in candidates if not REGEX_METACHAR_PATTERN.search(patterns[i])}
+            regex_candidates = [i for i in candidates if i not in found]
+            combined = None
+            if len(regex_candidates) > 1:
+                combined = self._get_combined_pattern([patterns[i] for i in regex_candidates])
+            if combined is not None:
+                for match in combined.finditer(content):
+                    found.add(regex_candidates[int(match.lastgroup[1:])])
+                    if len(found) == len(candidates):
+                        break
+        
+        # One pattern can hide another that overlaps it in the alternation,
+        # so anything the combined scan didn't see is checked on its own
+        return [
+            (True, None) if i in found
+            else (False, "pattern not found") if i in ruled_out
+            else self._search_pattern_in_file(file_path, pattern)
+            for i, pattern in enumerate(patterns)
+        ]
+    
     def check_code_patterns(self, feature):
         """Check if code patterns exist in specified files"""
         if 'code_patterns' not in feature:
             return True, []
         
+        # Group patterns by file so each file is scanned once
+        patterns_by_file = {}
+        for pattern_def in feature['code_patterns']:
+            patterns_by_file.setdefault(pattern_def['file'], []).append(pattern_def['pattern'])
+        search_results = {
+            file_path: iter(self._search_patterns_in_file(file_path, patterns))
+            for file_path, patterns in patterns_by_file.items()
+        }
+        
         missing = []
         for pattern_def in feature['code_patterns']:
             file_path = pattern_def['file']
             pattern = pattern_def['pattern']
             desc = pattern_def.get('description', pattern)
             
-            found, reason = self._search_pattern_in_file(file_path, pattern)
+            found, reason = next(search_results[file_path])
             if not found:
                 missing.append({
                     'file': file_path,
@@ -104,26 +302,33 @@ class FeatureVerifier:
         
         return len(missing) == 0, missing
     
+    def _get_config_keys(self, config_file):
+        """
+        All key paths of a JSON config file, e.g. ('map', 'center'), parsed
+        and flattened once per run (empty if the file is missing/invalid)
+        """
+        if config_file not in self._config_cache:
+            key_paths = set()
+            full_path = self.repo_root / config_file
+            try:
+                with open(full_path, 'r', encoding='utf-8') as f:
+                    pending = [((), json.load(f))]
+            except Exception:
+                pending = []
+            while pending:
+                prefix, value = pending.pop()
+                if isinstance(value, dict):
+                    for k, child in value.items():
+                        path = prefix + (k,)
+                        key_paths.add(path)
+                        pending.append((path, child))
+            self._config_cache[config_file] = key_paths
+        return self._config_cache[config_file]
+    
     def _check_config_key_in_file(self, config_file, key):
         """Check if a config key exists in a JSON file"""
-        full_path = self.repo_root / config_file
-        if not full_path.exists():
-            return False
-        
-        try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            
-            # Support nested keys like "map.center"
-            keys = key.split('.')
-            value = config
-            for k in keys:
-                if not isinstance(value, dict) or k not in value:
-                    return False
-                value = value[k]
-            return True
-        except Exception:
-            return False
+        # Support nested keys like "map.center"
+        return tuple(key.split('.')) in self._get_config_keys(config_file)
     
     def check_config_keys(self, feature):
         """Check if required config keys exist"""
@@ -150,6 +355,13 @@ class FeatureVerifier:
     
     def verify_feature(self, feature):
         """Verify a single feature"""
+        try:
+            return self._verify_feature(feature)
+        finally:
+            self._release_caches()
+    
+    def _verify_feature(self, feature):
+        """Run the file, pattern and config checks of one feature"""
         feature_id = feature.get('id', 'unknown')
         feature_name = feature.get('name', 'Unknown')
         
@@ -173,6 +385,8 @@ class FeatureVerifier:
         if not files_exist:
             result['status'] = 'failed'
             self.log(f"  Files check FAILED: {len(missing_files)} missing", "ERROR")
+            if self.fail_fast:
+                return result
         else:
             self.log("  Files check PASSED")
         
@@ -211,6 +425,28 @@ class FeatureVerifier:
         
         self.results['total'] = len(features)
         
+        # Sources are re-read on every run (TUI and daemon verify repeatedly)
+        try:
+            self._verify_features(features)
+        finally:
+            self._release_caches()
+        return self.results
+    
+    def _verify_features(self, features):
+        """Verify features into self.results, in registry order"""
+        # Features are independent, so they are verified on a thread pool
+        # (file reads overlap). Verbose runs stay serial so each feature's
+        # log lines stay together.
+        implemented = [f for f in features if f.get('implemented', self.DEFAULT_IMPLEMENTED)]
+        # Fail-fast runs are serial too, so no feature after the first
+        # failure gets verified.
+        if self.verbose or self.fail_fast or len(implemented) < 2:
+            verified = map(self._verify_feature, implemented)
+        else:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                verified = list(executor.map(self._verify_feature, implemented))
+        verified = iter(verified)
+        
         for feature in features:
             # Skip features that are not implemented
             if not feature.get('implemented', self.DEFAULT_IMPLEMENTED):
@@ -226,73 +462,79 @@ class FeatureVerifier:
                 self.results['skipped'] += 1
                 continue
             
-            result = self.verify_feature(feature)
+            result = next(verified)
             self.results['features'].append(result)
             
             if result['status'] == 'passed':
                 self.results['passed'] += 1
             else:
                 self.results['failed'] += 1
-        
-        return self.results
+                if self.fail_fast:
+                    self.log("Stopping at first failure (--fail-fast)", "ERROR")
+                    break
     
     def print_summary(self, results):
         """Print human-readable summary"""
-        print("=" * 60)
-        print("Feature Verification Summary")
-        print("=" * 60)
+        # Collect the summary and write it once instead of one print per line
+        out = io.StringIO()
+        print("=" * 60, file=out)
+        print("Feature Verification Summary", file=out)
+        print("=" * 60, file=out)
         
         skipped_count = results.get('skipped', 0)
         
-        print(f"\nTotal Features: {results['total']}")
-        print(f"Passed: {results['passed']}")
-        print(f"Failed: {results['failed']}")
-        print(f"Skipped (Not Implemented): {skipped_count}")
+        print(f"\nTotal Features: {results['total']}", file=out)
+        print(f"Passed: {results['passed']}", file=out)
+        print(f"Failed: {results['failed']}", file=out)
+        print(f"Skipped (Not Implemented): {skipped_count}", file=out)
         
         if skipped_count > 0:
-            print("\nSkipped features (not implemented):")
+            print("\nSkipped features (not implemented):", file=out)
             skipped_features = [f for f in results['features'] if f['status'] == 'skipped']
             for feature in skipped_features:
-                print(f"  ⊝ {feature['name']} ({feature['id']})")
+                print(f"  ⊝ {feature['name']} ({feature['id']})", file=out)
         
         if results['failed'] > 0:
-            print("\nFailed features:")
+            print("\nFailed features:", file=out)
             for feature in results['features']:
                 if feature['status'] != 'failed':
                     continue
                 
-                print(f"\n  ✗ {feature['name']} ({feature['id']})")
+                print(f"\n  ✗ {feature['name']} ({feature['id']})", file=out)
                 for check in feature['checks']:
                     if check['passed']:
                         continue
                     
-                    print(f"    - {check['type']}: FAILED")
+                    print(f"    - {check['type']}: FAILED", file=out)
                     
                     if 'missing_files' in check and check['missing_files']:
                         for f in check['missing_files']:
-                            print(f"      Missing file: {f}")
+                            print(f"      Missing file: {f}", file=out)
                     
                     if 'missing_patterns' in check and check['missing_patterns']:
                         for p in check['missing_patterns']:
-                            print(f"      Missing pattern: {p['description']}")
-                            print(f"        in {p['file']}: {p['reason']}")
+                            print(f"      Missing pattern: {p['description']}", file=out)
+                            print(f"        in {p['file']}: {p['reason']}", file=out)
                     
                     if 'missing_keys' in check and check['missing_keys']:
                         for k in check['missing_keys']:
-                            print(f"      Missing config key: {k}")
+                            print(f"      Missing config key: {k}", file=out)
         
-        print("=" * 60)
+        print("=" * 60, file=out)
         
         if results['failed'] == 0:
             if skipped_count > 0:
-                print(f"\n✓ All implemented features verified successfully!")
-                print(f"  ({skipped_count} feature(s) marked as not implemented)")
+                print(f"\n✓ All implemented features verified successfully!", file=out)
+                print(f"  ({skipped_count} feature(s) marked as not implemented)", file=out)
             else:
-                print("\n✓ All features verified successfully!")
-            return 0
+                print("\n✓ All features verified successfully!", file=out)
+            exit_code = 0
         else:
-            print(f"\n✗ {results['failed']} feature(s) failed verification")
-            return 1
+            print(f"\n✗ {results['failed']} feature(s) failed verification", file=out)
+            exit_code = 1
+        
+        sys.stdout.write(out.getvalue())
+        return exit_code
 
 
 def run_tui(verifier):
@@ -516,13 +758,19 @@ def main():
         action="store_true",
         help="Watch file system for changes (daemon mode only)"
     )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first failing feature and skip its remaining checks"
+    )
     
     args = parser.parse_args()
     
     # Initialize verifier
     verifier = FeatureVerifier(
         repo_root=args.repo_root,
-        verbose=args.verbose
+        verbose=args.verbose,
+        fail_fast=args.fail_fast
     )
     
     # Launch appropriate mode
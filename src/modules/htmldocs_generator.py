@@ -5,16 +5,161 @@ Generates styled HTML documentation from Markdown files in docs/ directory.
 Uses the application's Barbie Pink color scheme and Lucide icons.
 """
 
+import os
+import re
 import json
+import hashlib
 import logging
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 import markdown
 from pygments.formatters import HtmlFormatter
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Bump when Markdown extensions/options change so cached HTML is rebuilt
+MARKDOWN_CACHE_VERSION = 3
+
+# Threads used to write generated pages while further pages are built
+DOCS_WRITE_WORKERS = 8
+
+# Below this many uncached documents, starting worker processes costs more
+# than converting serially
+PARALLEL_CONVERT_MIN_DOCS = 8
+
+# Markdown extensions used for every document (also in worker processes)
+MARKDOWN_EXTENSIONS = [
+    'extra',  # Tables, fenced code blocks, etc.
+    'codehilite',  # Syntax highlighting
+    'sane_lists'  # Better list handling
+]
+
+# Lucide icon per documentation filename keyword
+DOC_ICON_MAP = {
+    'CHANGELOG': 'git-branch',
+    'COLOR_SCHEME': 'palette',
+    'DEPENDENCY': 'package',
+    'EASY': 'zap',
+    'IMPLEMENTATION': 'check-circle',
+    'KISS': 'heart',
+    'LEAFLET': 'map',
+    'LUCIDE': 'smile',
+    'MARKDOWN': 'file-text',
+    'PROOF': 'shield-check',
+    'PYTHON': 'code',
+    'QUICK_REFERENCE': 'bookmark',
+    'SSG': 'folder',
+}
+# All keywords in one alternation: a single scan finds the first keyword
+DOC_ICON_PATTERN = re.compile('|'.join(map(re.escape, DOC_ICON_MAP)))
+
+# First non-blank line that doesn't start with '#', captured without the
+# surrounding whitespace (index card preview)
+PREVIEW_LINE_PATTERN = re.compile(r'^(?!#)[^\S\n]*(\S(?:[^\n]*\S)?)', re.M)
+
+# Markup for one navigation entry and one index card (filled via format_map)
+NAV_ITEM_TEMPLATE = """
+            <li class="docs-nav-item">
+                <a href="{href}" class="docs-nav-link{active}">
+                    <span class="docs-nav-icon">{icon}</span>
+                    <span>{title}</span>
+                </a>
+            </li>"""
+
+INDEX_CARD_TEMPLATE = """
+            <div class="docs-index-card">
+                <h3>
+                    <span class="docs-index-card-icon">{icon}</span>
+                    <a href="{href}">{title}</a>
+                </h3>
+                <p>{description}</p>
+            </div>"""
+
+# Fixed fragments of a documentation page, named after the element each
+# one opens or closes. generate_html joins them with the per-page title,
+# stylesheet href, logo icon, navigation, back-link icon and content.
+PAGE_HEAD_OPEN = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>"""
+
+PAGE_TITLE_CLOSE = """ - KRWL HOF Documentation</title>
+    <meta name="description" content="KRWL HOF Community Events Documentation">
+    <link rel="stylesheet" href=\""""
+
+PAGE_HEAD_CLOSE = """">
+</head>
+<body>
+    <div class="docs-container">
+        <!-- Sidebar Navigation -->
+        <nav class="docs-sidebar">
+            <div class="docs-logo">
+                <span class="docs-logo-icon">"""
+
+PAGE_NAV_OPEN = """</span>
+                <span class="docs-logo-text">Docs</span>
+            </div>
+            <ul class="docs-nav">
+"""
+
+PAGE_NAV_CLOSE = """
+            </ul>
+        </nav>
+        
+        <!-- Main Content -->
+        <main class="docs-main">
+            <a href="../index.html" class="back-to-app">
+                <span style="display: inline-flex; align-items: center; width: 18px; height: 18px;">"""
+
+PAGE_ARTICLE_OPEN = """</span>
+                Back to App
+            </a>
+            <article class="docs-content">
+"""
+
+PAGE_ARTICLE_CLOSE = """
+            </article>
+        </main>
+    </div>
+</body>
+</html>"""
+
+# Per-process Markdown renderer for _convert_markdown_worker
+_worker_render = None
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config(config_path: str, mtime: float) -> Dict:
+    """Parse config.json once per file version, shared by all generators"""
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
+
+def create_markdown_renderer():
+    """Create a callable that converts a Markdown string to HTML"""
+    md = markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    
+    def render(markdown_content: str) -> str:
+        # Reset markdown processor for new document
+        md.reset()
+        return md.convert(markdown_content)
+    
+    return render
+
+
+def _convert_markdown_worker(markdown_content: str) -> str:
+    """Convert one Markdown document inside a worker process"""
+    global _worker_render
+    if _worker_render is None:
+        _worker_render = create_markdown_renderer()
+    return _worker_render(markdown_content)
+
 
 class DocsGenerator:
     """Generates styled documentation from Markdown files"""
@@ -25,29 +170,127 @@ class DocsGenerator:
         self.docs_output_path = self.base_path / 'public' / 'docs'
         self.assets_path = self.base_path / 'assets'
         self.config_path = self.base_path / 'config.json'
+        self.cache_file = self.base_path / '.cache' / 'docs_cache.json'
         
         # Ensure output directory exists
         self.docs_output_path.mkdir(parents=True, exist_ok=True)
         
-        # Load config for design tokens
-        with open(self.config_path, 'r') as f:
-            self.config = json.load(f)
+        # Converted Markdown keyed by doc name: {'hash': ..., 'html': ...}
+        self.md_cache = self._load_md_cache()
+        
+        # Generated stylesheet (built on first generate_docs_css call)
+        self._css = None
+        
+        # Rendered navigation entries, reused for every page of a run
+        self._nav_doc_files = None
+        self._nav_items = []
         
         # Configure Markdown processor
-        self.md = markdown.Markdown(extensions=[
-            'extra',  # Tables, fenced code blocks, etc.
-            'codehilite',  # Syntax highlighting
-            'toc',  # Table of contents
-            'meta',  # Metadata
-            'sane_lists'  # Better list handling
-        ])
+        self.render_markdown = create_markdown_renderer()
+    
+    @property
+    def config(self) -> Dict:
+        """Site config with the design tokens (loaded on first use)"""
+        return _load_config(str(self.config_path), self.config_path.stat().st_mtime)
     
     def get_doc_files(self) -> List[Path]:
         """Get all Markdown files in docs directory"""
         return sorted(self.docs_source_path.glob('*.md'))
     
+    def _load_md_cache(self) -> Dict[str, Dict[str, str]]:
+        """Load converted Markdown cache from disk (empty if missing/invalid)"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if cache.get('version') != MARKDOWN_CACHE_VERSION:
+            return {}
+        return cache.get('entries', {})
+    
+    def _save_md_cache(self):
+        """Write converted Markdown cache atomically"""
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': MARKDOWN_CACHE_VERSION, 'entries': self.md_cache}, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            logger.warning(f"Failed to save docs cache: {e}")
+    
+    def _get_cached_html(self, doc_file: Path, content_hash: str):
+        """Return cached HTML for doc_file if its content hash matches"""
+        cached = self.md_cache.get(doc_file.name)
+        if cached and cached.get('hash') == content_hash:
+            logger.debug(f"Cache hit: {doc_file.name}")
+            return cached['html']
+        return None
+    
+    @staticmethod
+    def _hash_content(raw_markdown: bytes) -> str:
+        """Hash raw Markdown source bytes for the conversion cache"""
+        return hashlib.blake2b(raw_markdown, digest_size=16).hexdigest()
+    
+    def convert_markdown(self, doc_file: Path, markdown_content: str) -> str:
+        """Convert Markdown to HTML, reusing cached HTML for unchanged content"""
+        content_hash = self._hash_content(markdown_content.encode('utf-8'))
+        content_html = self._get_cached_html(doc_file, content_hash)
+        if content_html is not None:
+            return content_html
+        
+        content_html = self.render_markdown(markdown_content)
+        self.md_cache[doc_file.name] = {'hash': content_hash, 'html': content_html}
+        return content_html
+    
+    def convert_documents(self, docs: List[Tuple[Path, str]],
+                          hashes: List[str] = None) -> List[str]:
+        """
+        Convert several Markdown documents to HTML.
+        
+        Cached documents are reused; the remaining ones are converted in a
+        process pool when there are at least PARALLEL_CONVERT_MIN_DOCS of
+        them, since python-markdown is pure Python and CPU-bound.
+        
+        Args:
+            docs: List of (doc_file, markdown_content) tuples
+            hashes: Content hashes of the raw source bytes, if already known
+            
+        Returns:
+            Converted HTML in the same order as docs
+        """
+        if hashes is None:
+            hashes = [self._hash_content(content.encode('utf-8')) for _, content in docs]
+        results = [self._get_cached_html(doc_file, content_hash)
+                   for (doc_file, _), content_hash in zip(docs, hashes)]
+        misses = [i for i, html in enumerate(results) if html is None]
+        
+        converted = None
+        if len(misses) >= PARALLEL_CONVERT_MIN_DOCS:
+            try:
+                with ProcessPoolExecutor() as executor:
+                    converted = list(executor.map(
+                        _convert_markdown_worker, [docs[i][1] for i in misses]
+                    ))
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Parallel Markdown conversion unavailable ({e}), converting serially")
+        
+        for n, i in enumerate(misses):
+            doc_file, markdown_content = docs[i]
+            if converted is None:
+                results[i] = self.convert_markdown(doc_file, markdown_content)
+            else:
+                results[i] = converted[n]
+                self.md_cache[doc_file.name] = {'hash': hashes[i], 'html': converted[n]}
+        
+        return results
+    
     def generate_docs_css(self) -> str:
-        """Generate CSS for documentation using design tokens"""
+        """Generate CSS for documentation using design tokens (cached per instance)"""
+        if self._css is not None:
+            return self._css
+        
         colors = self.config['design']['colors']
         typography = self.config['design']['typography']
         spacing = self.config['design']['spacing']
@@ -225,6 +468,39 @@ body {{
     box-shadow: var(--shadow-medium);
 }}
 
+/* Index Cards */
+.docs-index-card {{
+    background: var(--color-bg-tertiary);
+    padding: var(--spacing-lg);
+    border-radius: var(--border-radius-medium);
+    margin-bottom: var(--spacing-md);
+}}
+
+.docs-content .docs-index-card h3 {{
+    margin-top: 0;
+    display: flex;
+    align-items: center;
+    gap: var(--spacing-sm);
+}}
+
+.docs-index-card-icon {{
+    color: var(--color-primary);
+    width: 24px;
+    height: 24px;
+    display: inline-flex;
+    flex-shrink: 0;
+}}
+
+.docs-content .docs-index-card a {{
+    color: var(--color-text-primary);
+    text-decoration: none;
+}}
+
+.docs-content .docs-index-card p {{
+    color: var(--color-text-secondary);
+    margin-bottom: 0;
+}}
+
 /* Back to App Link */
 .back-to-app {{
     display: inline-flex;
@@ -436,6 +712,7 @@ body {{
     background: var(--color-primary);
 }}
 """
+        self._css = css
         return css
     
     def get_icon_svg(self, icon_name: str) -> str:
@@ -464,132 +741,94 @@ body {{
     
     def get_icon_for_file(self, filename: str) -> str:
         """Get appropriate Lucide icon for documentation file"""
-        icon_map = {
-            'CHANGELOG': 'git-branch',
-            'COLOR_SCHEME': 'palette',
-            'DEPENDENCY': 'package',
-            'EASY': 'zap',
-            'IMPLEMENTATION': 'check-circle',
-            'KISS': 'heart',
-            'LEAFLET': 'map',
-            'LUCIDE': 'smile',
-            'MARKDOWN': 'file-text',
-            'PROOF': 'shield-check',
-            'PYTHON': 'code',
-            'QUICK_REFERENCE': 'bookmark',
-            'SSG': 'folder',
-        }
-        
-        for key, icon in icon_map.items():
-            if key in filename.upper():
-                return icon
+        match = DOC_ICON_PATTERN.search(filename.upper())
+        if match:
+            return DOC_ICON_MAP[match.group(0)]
         
         return 'file-text'  # Default icon
     
-    def generate_navigation(self, doc_files: List[Path], current_file: Path = None) -> str:
-        """Generate navigation HTML with inline Lucide SVG icons"""
+    def _render_nav_items(self, doc_files: List[Path]) -> List[Tuple[Path, str, str]]:
+        """Render navigation entries as (doc_file, inactive_html, active_html)"""
         nav_items = []
         
         for doc_file in doc_files:
             filename = doc_file.stem
-            icon_name = self.get_icon_for_file(filename)
-            icon_svg = self.get_icon_svg(icon_name)
-            # Convert filename to title (e.g., CHANGELOG -> Changelog)
-            title = filename.replace('_', ' ').title()
-            output_filename = f"{filename}.html"
-            
-            active_class = ' active' if current_file and doc_file == current_file else ''
-            
-            nav_items.append(f'''
-            <li class="docs-nav-item">
-                <a href="{output_filename}" class="docs-nav-link{active_class}">
-                    <span class="docs-nav-icon">{icon_svg}</span>
-                    <span>{title}</span>
-                </a>
-            </li>
-            ''')
+            fields = {
+                'href': f"{filename}.html",
+                'icon': self.get_icon_svg(self.get_icon_for_file(filename)),
+                # Convert filename to title (e.g., CHANGELOG -> Changelog)
+                'title': filename.replace('_', ' ').title(),
+            }
+            nav_items.append((
+                doc_file,
+                NAV_ITEM_TEMPLATE.format_map({**fields, 'active': ''}),
+                NAV_ITEM_TEMPLATE.format_map({**fields, 'active': ' active'}),
+            ))
+        
+        return nav_items
+    
+    def generate_navigation(self, doc_files: List[Path], current_file: Path = None) -> str:
+        """Generate navigation HTML with inline Lucide SVG icons"""
+        # Entries are rendered once per doc list; only the active marker changes
+        if self._nav_doc_files != doc_files:
+            self._nav_items = self._render_nav_items(doc_files)
+            self._nav_doc_files = list(doc_files)
         
-        return '\n'.join(nav_items)
+        return ''.join(
+            active_html if current_file and doc_file == current_file else inactive_html
+            for doc_file, inactive_html, active_html in self._nav_items
+        )
     
-    def generate_html(self, doc_file: Path, content_html: str, navigation: str) -> str:
-        """Generate complete HTML document"""
+    def generate_html(self, doc_file: Path, content_html: str, navigation: str,
+                      css_href: str = 'docs.css') -> str:
+        """Generate complete HTML document (styles linked from css_href)"""
         filename = doc_file.stem
         title = filename.replace('_', ' ').title()
-        css = self.generate_docs_css()
         
         # Get inline SVG for logo icon
         logo_svg = self.get_icon_svg('book-open')
         arrow_svg = self.get_icon_svg('arrow-left')
         
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - KRWL HOF Documentation</title>
-    <meta name="description" content="KRWL HOF Community Events Documentation">
-    <style>
-{css}
-    </style>
-</head>
-<body>
-    <div class="docs-container">
-        <!-- Sidebar Navigation -->
-        <nav class="docs-sidebar">
-            <div class="docs-logo">
-                <span class="docs-logo-icon">{logo_svg}</span>
-                <span class="docs-logo-text">Docs</span>
-            </div>
-            <ul class="docs-nav">
-{navigation}
-            </ul>
-        </nav>
-        
-        <!-- Main Content -->
-        <main class="docs-main">
-            <a href="../index.html" class="back-to-app">
-                <span style="display: inline-flex; align-items: center; width: 18px; height: 18px;">{arrow_svg}</span>
-                Back to App
-            </a>
-            <article class="docs-content">
-{content_html}
-            </article>
-        </main>
-    </div>
-</body>
-</html>"""
-        return html
+        return ''.join([
+            PAGE_HEAD_OPEN, title,
+            PAGE_TITLE_CLOSE, css_href,
+            PAGE_HEAD_CLOSE, logo_svg,
+            PAGE_NAV_OPEN, navigation,
+            PAGE_NAV_CLOSE, arrow_svg,
+            PAGE_ARTICLE_OPEN, content_html,
+            PAGE_ARTICLE_CLOSE,
+        ])
     
-    def generate_index(self, doc_files: List[Path]) -> str:
-        """Generate index page listing all documentation"""
+    @staticmethod
+    def extract_preview(markdown_content: str) -> str:
+        """Get first non-heading line of a Markdown document (max 150 chars)"""
+        match = PREVIEW_LINE_PATTERN.search(markdown_content)
+        if not match:
+            return ''
+        line = match.group(1)
+        return line[:150] + '...' if len(line) > 150 else line
+    
+    def generate_index(self, docs: List[Tuple[Path, str]]) -> str:
+        """
+        Generate index page listing all documentation.
+        
+        Args:
+            docs: List of (doc_file, markdown_content) tuples, as already
+                read by generate_all (files are not re-read)
+        """
+        doc_files = [doc_file for doc_file, _ in docs]
         navigation = self.generate_navigation(doc_files)
         
         content_items = []
-        for doc_file in doc_files:
+        for doc_file, markdown_content in docs:
             filename = doc_file.stem
-            icon_name = self.get_icon_for_file(filename)
-            icon_svg = self.get_icon_svg(icon_name)
-            title = filename.replace('_', ' ').title()
-            output_filename = f"{filename}.html"
-            
-            # Read first paragraph from markdown as description
-            with open(doc_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                description = ''
-                for line in lines:
-                    if line.strip() and not line.startswith('#'):
-                        description = line.strip()[:150] + '...' if len(line.strip()) > 150 else line.strip()
-                        break
-            
-            content_items.append(f'''
-            <div style="background: var(--color-bg-tertiary); padding: var(--spacing-lg); border-radius: var(--border-radius-medium); margin-bottom: var(--spacing-md);">
-                <h3 style="margin-top: 0; display: flex; align-items: center; gap: var(--spacing-sm);">
-                    <span style="color: var(--color-primary); width: 24px; height: 24px; display: inline-flex; flex-shrink: 0;">{icon_svg}</span>
-                    <a href="{output_filename}" style="color: var(--color-text-primary); text-decoration: none;">{title}</a>
-                </h3>
-                <p style="color: var(--color-text-secondary); margin-bottom: 0;">{description}</p>
-            </div>
-            ''')
+            content_items.append(INDEX_CARD_TEMPLATE.format_map({
+                'href': f"{filename}.html",
+                'icon': self.get_icon_svg(self.get_icon_for_file(filename)),
+                'title': filename.replace('_', ' ').title(),
+                # First paragraph from markdown as description
+                'description': self.extract_preview(markdown_content),
+            }))
         
         content_html = f"""
         <h1>Documentation</h1>
@@ -599,6 +838,19 @@ body {{
         
         return self.generate_html(Path('index.md'), content_html, navigation)
     
+    def _write_page(self, output_file: Path, content: str):
+        """Write one generated file (runs on the write thread pool)"""
+        output_file.write_bytes(content.encode('utf-8'))
+        logger.info(f"Generated {output_file}")
+    
+    @staticmethod
+    def _is_up_to_date(output_file: Path, input_mtime: float) -> bool:
+        """Check if a generated file is at least as new as its inputs"""
+        try:
+            return output_file.stat().st_mtime >= input_mtime
+        except OSError:
+            return False
+    
     def generate_all(self):
         """Generate HTML for all Markdown documentation files"""
         logger.info("Generating documentation HTML from Markdown files...")
@@ -610,43 +862,78 @@ body {{
         
         logger.info(f"Found {len(doc_files)} documentation files")
         
-        # Generate navigation HTML (same for all pages)
-        navigation = self.generate_navigation(doc_files)
+        # Inputs shared by every page: design tokens, this generator's
+        # templates, and the docs directory listing behind the navigation
+        shared_mtime = max(
+            self.config_path.stat().st_mtime,
+            Path(__file__).stat().st_mtime,
+            self.docs_source_path.stat().st_mtime,
+        )
         
-        # Generate each documentation page
+        # Read all Markdown documents (the index needs every preview), but
+        # only convert those whose page is older than its inputs
+        # (hashed as raw bytes; decoded only for the Markdown parser)
+        docs = []
+        stale_docs = []
+        hashes = []
         for doc_file in doc_files:
-            logger.info(f"Processing {doc_file.name}...")
-            
-            # Read and convert Markdown to HTML
-            with open(doc_file, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
+            raw_markdown = doc_file.read_bytes()
+            doc = (doc_file, raw_markdown.decode('utf-8'))
+            docs.append(doc)
+            output_file = self.docs_output_path / f"{doc_file.stem}.html"
+            input_mtime = max(shared_mtime, doc_file.stat().st_mtime)
+            if not self._is_up_to_date(output_file, input_mtime):
+                stale_docs.append(doc)
+                hashes.append(self._hash_content(raw_markdown))
+        
+        if len(stale_docs) < len(docs):
+            logger.info(f"Skipping {len(docs) - len(stale_docs)} up-to-date pages")
+        
+        # Convert everything before the write pool starts, so worker
+        # processes are never forked while writer threads are running
+        contents = self.convert_documents(stale_docs, hashes)
+        
+        # Pages are written on a thread pool so file I/O overlaps with
+        # page assembly
+        with ThreadPoolExecutor(max_workers=DOCS_WRITE_WORKERS) as executor:
+            writes = []
             
-            # Reset markdown processor for new document
-            self.md.reset()
-            content_html = self.md.convert(markdown_content)
+            # Write the shared stylesheet once; every page links to it
+            css_file = self.docs_output_path / 'docs.css'
+            if not self._is_up_to_date(css_file, shared_mtime):
+                writes.append(executor.submit(self._write_page, css_file, self.generate_docs_css()))
             
-            # Generate navigation with current file highlighted
-            current_nav = self.generate_navigation(doc_files, doc_file)
+            # Generate each changed documentation page
+            for (doc_file, _), content_html in zip(stale_docs, contents):
+                logger.info(f"Processing {doc_file.name}...")
+                
+                # Generate navigation with current file highlighted
+                current_nav = self.generate_navigation(doc_files, doc_file)
+                
+                # Generate complete HTML
+                html = self.generate_html(doc_file, content_html, current_nav)
+                
+                # Write to output
+                output_file = self.docs_output_path / f"{doc_file.stem}.html"
+                writes.append(executor.submit(self._write_page, output_file, html))
             
-            # Generate complete HTML
-            html = self.generate_html(doc_file, content_html, current_nav)
+            # Drop cache entries for docs that no longer exist
+            current_names = {doc_file.name for doc_file in doc_files}
+            self.md_cache = {name: entry for name, entry in self.md_cache.items()
+                             if name in current_names}
+            self._save_md_cache()
             
-            # Write to output
-            output_file = self.docs_output_path / f"{doc_file.stem}.html"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html)
+            # Generate index page
+            logger.info("Generating documentation index...")
+            index_html = self.generate_index(docs)
+            index_file = self.docs_output_path / 'index.html'
+            writes.append(executor.submit(self._write_page, index_file, index_html))
             
-            logger.info(f"Generated {output_file}")
-        
-        # Generate index page
-        logger.info("Generating documentation index...")
-        index_html = self.generate_index(doc_files)
-        index_file = self.docs_output_path / 'index.html'
-        with open(index_file, 'w', encoding='utf-8') as f:
-            f.write(index_html)
-        logger.info(f"Generated {index_file}")
+            # Surface any write error
+            for write in writes:
+                write.result()
         
-        logger.info(f"Documentation generation complete! {len(doc_files)} pages created.")
+        logger.info(f"Documentation generation complete! {len(stale_docs)} of {len(doc_files)} pages updated.")
 
 
 def main():
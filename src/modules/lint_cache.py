@@ -0,0 +1,81 @@
+"""
+Lint Cache Module
+
+Keeps the linter's per-file (CSS/JS/SVG) results between site builds, keyed
+by content hash, so unchanged files are not linted again.
+
+Uses Python standard library only - no external dependencies required.
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional
+
+
+class LintCache:
+    """Per-file lint results stored as JSON ({'version', 'entries'})"""
+    
+    def __init__(self, cache_file: Path, source_files: Iterable[Path]):
+        """
+        Args:
+            cache_file: JSON file holding the cached results
+            source_files: Sources the cached results depend on (lint rules,
+                result format); any change to them invalidates every
+                cached result
+        """
+        self.cache_file = Path(cache_file)
+        digest = hashlib.sha256()
+        for source_file in source_files:
+            digest.update(hashlib.sha256(Path(source_file).read_bytes()).digest())
+        self.version = digest.hexdigest()
+        # Results keyed by '<check>:<filename>': {'hash': ..., 'result': ...}
+        self.entries = self._load()
+        # Keys looked up this run; entries for files no longer linted are
+        # dropped on save
+        self._seen = set()
+    
+    @staticmethod
+    def hash_content(content: str) -> str:
+        """Hash file content for cache lookups"""
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load cached results from disk (empty if missing/invalid/outdated)"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if cache.get('version') != self.version:
+            return {}
+        return cache.get('entries', {})
+    
+    def get(self, key: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        """Cached result for key if its content hash matches, else None"""
+        self._seen.add(key)
+        cached = self.entries.get(key)
+        if cached and cached.get('hash') == content_hash:
+            return cached['result']
+        return None
+    
+    def put(self, key: str, content_hash: str, result: Dict[str, Any]):
+        """Store the result for key's current content"""
+        self._seen.add(key)
+        self.entries[key] = {'hash': content_hash, 'result': result}
+    
+    def save(self):
+        """
+        Write the results of this run atomically.
+        
+        Raises:
+            OSError: If the cache file can't be written
+        """
+        self.entries = {key: entry for key, entry in self.entries.items() if key in self._seen}
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.version, 'entries': self.entries}, f)
+        os.replace(tmp_file, self.cache_file)
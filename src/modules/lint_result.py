@@ -0,0 +1,75 @@
+"""
+Lint Result Module
+
+Result container shared by the linter checks and the lint cache.
+
+Uses Python standard library only - no external dependencies required.
+"""
+
+from typing import Dict, List, Any
+
+
+class LintResult:
+    """Container for lint results"""
+    def __init__(self, passed: bool = True, errors: List[str] = None, warnings: List[str] = None):
+        self.passed = passed
+        self.errors = errors or []
+        self.warnings = warnings or []
+        # Structured warnings with context for clickable UI
+        self.structured_warnings = []
+    
+    def add_error(self, message: str):
+        self.errors.append(message)
+        self.passed = False
+    
+    def add_warning(self, message: str, category: str = None, rule: str = None, context: str = None):
+        """
+        Add a warning with optional structured metadata.
+        
+        Args:
+            message: Warning message
+            category: Category (e.g., "accessibility", "css", "javascript", "html")
+            rule: WCAG rule or lint rule (e.g., "WCAG 1.1.1", "bracket-matching")
+            context: Additional context (e.g., file location, code snippet)
+        """
+        self.warnings.append(message)
+        # Add structured version for clickable UI
+        self.structured_warnings.append({
+            'message': message,
+            'category': category or 'general',
+            'rule': rule or '',
+            'context': context or ''
+        })
+    
+    def merge(self, other: 'LintResult'):
+        """Merge another result into this one"""
+        # Most merged results are clean: skip the extends for them
+        if other.errors:
+            self.errors.extend(other.errors)
+        if other.warnings:
+            self.warnings.extend(other.warnings)
+        if getattr(other, 'structured_warnings', None):
+            self.structured_warnings.extend(other.structured_warnings)
+        if not other.passed:
+            self.passed = False
+    
+    def to_json(self) -> Dict[str, Any]:
+        """Export lint results as JSON for embedding in HTML"""
+        return {
+            'passed': self.passed,
+            'error_count': len(self.errors),
+            'warning_count': len(self.warnings),
+            'errors': self.errors,
+            'warnings': self.warnings,
+            'structured_warnings': self.structured_warnings
+        }
+    
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> 'LintResult':
+        """Rebuild a result exported with to_json"""
+        result = cls(passed=data['passed'], errors=list(data['errors']), warnings=list(data['warnings']))
+        result.structured_warnings = list(data['structured_warnings'])
+        return result
+    
+    def __bool__(self):
+        return self.passed
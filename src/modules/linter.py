@@ -7,87 +7,86 @@ during the HTML export process.
 Uses Python standard library only - no external dependencies required.
 """
 
+import io
 import re
+import sys
 import json
 import html.parser
 from typing import Dict, List, Tuple, Any
 from pathlib import Path
 
+from .lint_cache import LintCache
+from .lint_result import LintResult
+from .component_linter import ComponentLinter
 
-class LintResult:
-    """Container for lint results"""
-    def __init__(self, passed: bool = True, errors: List[str] = None, warnings: List[str] = None):
-        self.passed = passed
-        self.errors = errors or []
-        self.warnings = warnings or []
-        # Structured warnings with context for clickable UI
-        self.structured_warnings = []
-    
-    def add_error(self, message: str):
-        self.errors.append(message)
-        self.passed = False
-    
-    def add_warning(self, message: str, category: str = None, rule: str = None, context: str = None):
-        """
-        Add a warning with optional structured metadata.
-        
-        Args:
-            message: Warning message
-            category: Category (e.g., "accessibility", "css", "javascript", "html")
-            rule: WCAG rule or lint rule (e.g., "WCAG 1.1.1", "bracket-matching")
-            context: Additional context (e.g., file location, code snippet)
-        """
-        self.warnings.append(message)
-        # Add structured version for clickable UI
-        self.structured_warnings.append({
-            'message': message,
-            'category': category or 'general',
-            'rule': rule or '',
-            'context': context or ''
-        })
-    
-    def merge(self, other: 'LintResult'):
-        """Merge another result into this one"""
-        self.errors.extend(other.errors)
-        self.warnings.extend(other.warnings)
-        if hasattr(other, 'structured_warnings'):
-            self.structured_warnings.extend(other.structured_warnings)
-        if not other.passed:
-            self.passed = False
-    
-    def to_json(self) -> Dict[str, Any]:
-        """Export lint results as JSON for embedding in HTML"""
-        return {
-            'passed': self.passed,
-            'error_count': len(self.errors),
-            'warning_count': len(self.warnings),
-            'errors': self.errors,
-            'warnings': self.warnings,
-            'structured_warnings': self.structured_warnings
-        }
-    
-    def __bool__(self):
-        return self.passed
+# Per-element accessibility issues reported for one rule before the rest
+# are summarized in a single warning
+MAX_PER_RULE = 50
+
+# Sources the cached per-file results depend on: the lint rules and the
+# LintResult format they are stored in
+LINT_CACHE_SOURCES = (Path(__file__), Path(__file__).with_name('lint_result.py'))
+
+# Lint patterns, compiled once at import. The linted sources are markup
+# and code, so re.ASCII keeps \b, \s, \w, \d and case folding to ASCII tables
+# JavaScript
+# The word boundary is checked behind the literal: a leading \b would stop
+# the engine from jumping straight to candidate 'eval'/'alert' positions.
+# No re.ASCII here: JS identifiers may contain non-ASCII letters, so \b must
+# not match between 'é' and 'eval' in 'éeval('.
+EVAL_PATTERN = re.compile(r'eval(?<=\beval)\s*\(')
+ALERT_PATTERN = re.compile(r'alert(?<=\balert)\s*\(')
+# CSS
+# Each empty rule ends in one '{ }', so counting those counts the rules
+# (a leading [^}]* selector part only made the scan quadratic)
+EMPTY_CSS_RULE_PATTERN = re.compile(r'\{\s*\}', re.ASCII)
+# HTML
+DOCTYPE_PATTERN = re.compile(r'<!DOCTYPE\s+html>', re.IGNORECASE | re.ASCII)
+# SVG
+SVG_SCRIPT_PATTERN = re.compile(r'<script[^>]*>', re.IGNORECASE | re.ASCII)
+SVG_EVENT_HANDLERS = ['onclick', 'onload', 'onerror', 'onmouseover', 'onmouseout']
+# One named group per handler, so a match names its handler whatever the case
+SVG_EVENT_HANDLER_PATTERN = re.compile(
+    '(?:' + '|'.join(f'(?P<{h}>{h})' for h in SVG_EVENT_HANDLERS) + r')\s*=', re.IGNORECASE | re.ASCII
+)
+SVG_EXTERNAL_REF_PATTERN = re.compile(r'xlink:href\s*=\s*["\']https?://', re.IGNORECASE | re.ASCII)
+# Accessibility
+HTML_LANG_PATTERN = re.compile(r'<html[^>]*\slang\s*=', re.IGNORECASE | re.ASCII)
+# <img>, <input> and <h1>-<h6> tags in one pass. The lookahead leaves the
+# scan free to find a tag inside another one's attributes, as separate
+# per-tag searches would
+A11Y_TAG_PATTERN = re.compile(
+    r'<(?=(?P<tag>(?:(?P<img>img)|(?P<input>input)|h(?P<level>[1-6]))[^>]*>))',
+    re.IGNORECASE | re.ASCII
+)
+EMPTY_ALT_PATTERN = re.compile(r'alt\s*=\s*["\']["\']', re.IGNORECASE | re.ASCII)
+# <a href="..."> and </a> are searched separately: once no </a> is left
+# the link scan can stop, where a single (.*?)</a> pattern would retry
+# the rest of the page from every remaining <a
+LINK_START_PATTERN = re.compile(r'<a\s+[^>]*href\s*=\s*["\'][^"\']*["\'][^>]*>', re.IGNORECASE | re.ASCII)
+LINK_END_PATTERN = re.compile(r'</a>', re.IGNORECASE | re.ASCII)
 
 
 class HTMLValidator(html.parser.HTMLParser):
     """Simple HTML validator using standard library"""
+    # Void elements: never pushed on the tag stack
+    SELF_CLOSING = frozenset({'meta', 'link', 'br', 'hr', 'img', 'input', 'area', 'base', 'col', 'embed', 'source', 'track', 'wbr'})
+    
     def __init__(self):
         super().__init__()
         self.errors = []
         self.warnings = []
         self.structured_warnings = []
         self.tag_stack = []
-        self.self_closing_tags = {'meta', 'link', 'br', 'hr', 'img', 'input', 'area', 'base', 'col', 'embed', 'source', 'track', 'wbr'}
     
     def handle_starttag(self, tag, attrs):
-        if tag not in self.self_closing_tags:
+        if tag not in self.SELF_CLOSING:
             self.tag_stack.append(tag)
         
         # Check for required attributes
+        # attrs is a short list of (name, value) pairs: scan it directly
         if tag == 'img':
-            attr_dict = dict(attrs)
-            if 'alt' not in attr_dict:
+            if not any(name == 'alt' for name, _ in attrs):
                 warning_msg = f"Image tag missing 'alt' attribute (accessibility issue)"
                 self.warnings.append(warning_msg)
                 self.structured_warnings.append({
@@ -98,10 +97,16 @@ class HTMLValidator(html.parser.HTMLParser):
                 })
         
         if tag == 'a':
-            attr_dict = dict(attrs)
-            if 'href' in attr_dict and attr_dict['href'].startswith('http'):
+            href = None
+            rel = ''
+            for name, value in attrs:
+                if name == 'href':
+                    href = value
+                elif name == 'rel':
+                    rel = value or ''
+            if href and href.startswith('http'):
                 # External link - check for security attributes
-                if 'rel' not in attr_dict or 'noopener' not in attr_dict.get('rel', ''):
+                if 'noopener' not in rel:
                     warning_msg = f"External link missing 'rel=\"noopener noreferrer\"' (security issue)"
                     self.warnings.append(warning_msg)
                     self.structured_warnings.append({
@@ -112,7 +117,7 @@ class HTMLValidator(html.parser.HTMLParser):
                     })
     
     def handle_endtag(self, tag):
-        if tag in self.self_closing_tags:
+        if tag in self.SELF_CLOSING:
             return
         
         if not self.tag_stack:
@@ -126,6 +131,9 @@ class HTMLValidator(html.parser.HTMLParser):
     
     def validate(self, html_content: str) -> LintResult:
         """Validate HTML structure"""
+        # Start from a clean parser: a previous document may have left an
+        # incomplete tag in the buffer or ended inside <script>/<style>
+        self.reset()
         self.errors = []
         self.warnings = []
         self.structured_warnings = []
@@ -147,18 +155,176 @@ class HTMLValidator(html.parser.HTMLParser):
         return result
 
 
-class Linter:
+def _has_visible_text(content: str) -> bool:
+    """
+    Check whether text remains once tags (<...>) are removed.
+    
+    Returns on the first visible character instead of building the
+    stripped string.
+    """
+    i = 0
+    end = len(content)
+    while i < end:
+        ch = content[i]
+        if ch == '<':
+            close = content.find('>', i + 2)
+            if close != -1 and content[i + 1] != '>':
+                # A tag: skip past its closing '>'
+                i = close + 1
+                continue
+            # '<>' or an unclosed '<' is text, not a tag
+            return True
+        if not ch.isspace():
+            return True
+        i += 1
+    return False
+
+
+def _add_suppressed_warning(result: LintResult, count: int, what: str):
+    """Summarize the issues of a rule beyond the first MAX_PER_RULE"""
+    if count > MAX_PER_RULE:
+        result.add_warning(
+            f"(+{count - MAX_PER_RULE} more {what}, suppressed)",
+            category="accessibility"
+        )
+
+
+def _walk_translations(translations: Any) -> Tuple[List[str], set]:
+    """
+    Walk a translation tree once for both translation checks.
+    
+    Returns:
+        (paths of empty string values in document order,
+         set of dotted key paths reachable through nested dicts)
+    """
+    empty_paths = []
+    keys = set()
+    # Depth-first with an explicit stack; children are pushed reversed so
+    # empty paths keep document order. 'keyed' marks the dict-only chain
+    # whose keys take part in the consistency check
+    stack = [("", translations, False, True)]
+    while stack:
+        path, obj, is_empty, keyed = stack.pop()
+        if is_empty:
+            # An empty string value found in a dict
+            empty_paths.append(path)
+        elif isinstance(obj, dict):
+            children = []
+            for key, value in obj.items():
+                current_path = f"{path}.{key}" if path else key
+                if keyed:
+                    keys.add(current_path)
+                if isinstance(value, str) and not value.strip():
+                    children.append((current_path, value, True, False))
+                elif isinstance(value, (dict, list)):
+                    children.append((current_path, value, False, keyed and isinstance(value, dict)))
+            stack.extend(reversed(children))
+        elif isinstance(obj, list):
+            stack.extend(reversed([(f"{path}[{i}]", item, False, False) for i, item in enumerate(obj)]))
+    return empty_paths, keys
+
+
+class Linter(ComponentLinter):
     """Main linter class for validating site generation output"""
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, cache_file: Path = None):
+        """
+        Args:
+            verbose: Print per-check progress and details
+            cache_file: Optional JSON file caching lint_all's per-file
+                (CSS/JS/SVG) results by content hash between runs
+        """
         self.verbose = verbose
         self.html_validator = HTMLValidator()
+        # (html_content, scan) of the last document scanned
+        self._html_scan = None
+        # (translations, walk) pairs shared by the checks of one lint_all run
+        self._translation_walks = None
+        # Stream lint_all reports to (None: sys.stdout)
+        self._out = None
+        self.file_cache = LintCache(cache_file, LINT_CACHE_SOURCES) if cache_file else None
     
     def log(self, message: str):
         """Log message if verbose mode enabled"""
         if self.verbose:
             print(f"  [Lint] {message}")
     
+    def _lint_file(self, check: str, content: str, filename: str) -> LintResult:
+        """Run lint_<check> on a file, reusing the cached result for unchanged content"""
+        lint = getattr(self, f"lint_{check}")
+        if self.file_cache is None:
+            return lint(content, filename)
+        
+        # Messages name the file, so the filename is part of the key
+        key = f"{check}:{filename}"
+        content_hash = LintCache.hash_content(content)
+        cached = self.file_cache.get(key, content_hash)
+        if cached is not None:
+            self.log(f"Unchanged, using cached result: {filename}")
+            return LintResult.from_json(cached)
+        
+        result = lint(content, filename)
+        self.file_cache.put(key, content_hash, result.to_json())
+        return result
+    
+    def _scan_html(self, html_content: str) -> Dict[str, Any]:
+        """
+        Collect the tags the HTML checks look at, in one pass over the page.
+        
+        The scan of the last document is kept, so lint_all's HTML and
+        accessibility checks share it.
+        """
+        if self._html_scan and self._html_scan[0] is html_content:
+            return self._html_scan[1]
+        
+        scan = {
+            # Lowercased once for all the case-insensitive presence checks
+            'lowered': html_content.lower(),
+            'img_tags': [],
+            'input_tags': [],
+            'heading_levels': [],
+            # (start, end) of each link's content
+            'link_spans': []
+        }
+        # End of the last tag of each kind, to skip tags nested inside it
+        last_end = {'img': 0, 'input': 0, 'level': 0}
+        for match in A11Y_TAG_PATTERN.finditer(html_content):
+            kind = 'img' if match.group('img') else 'input' if match.group('input') else 'level'
+            if match.start() < last_end[kind]:
+                continue
+            last_end[kind] = match.end('tag')
+            if kind == 'img':
+                scan['img_tags'].append('<' + match.group('tag'))
+            elif kind == 'input':
+                scan['input_tags'].append('<' + match.group('tag'))
+            else:
+                scan['heading_levels'].append(int(match.group('level')))
+        
+        pos = 0
+        while True:
+            start = LINK_START_PATTERN.search(html_content, pos)
+            if not start:
+                break
+            end = LINK_END_PATTERN.search(html_content, start.end())
+            if not end:
+                break
+            scan['link_spans'].append((start.end(), end.start()))
+            pos = end.end()
+        
+        self._html_scan = (html_content, scan)
+        return scan
+    
+    def _walk_translations(self, translations: Any) -> Tuple[List[str], set]:
+        """Walk a translation tree, once per tree within a lint_all run"""
+        if self._translation_walks is None:
+            return _walk_translations(translations)
+        for walked, walk in self._translation_walks:
+            if walked is translations:
+                return walk
+        walk = _walk_translations(translations)
+        self._translation_walks.append((translations, walk))
+        return walk
+    
     # ==================== JavaScript Validation ====================
     
     def lint_javascript(self, js_content: str, filename: str = "script") -> LintResult:
@@ -174,36 +340,18 @@ class Linter:
             return result
         
         # Check for console.log in production (warning only)
-        console_logs = re.findall(r'console\.log\(', js_content)
+        console_logs = js_content.count('console.log(')
         if console_logs:
-            result.add_warning(f"{filename}: Found {len(console_logs)} console.log statements (consider removing for production)")
+            result.add_warning(f"{filename}: Found {console_logs} console.log statements (consider removing for production)")
         
         # Check for eval() usage (security risk)
-        if re.search(r'\beval\s*\(', js_content):
+        if EVAL_PATTERN.search(js_content):
             result.add_error(f"{filename}: Found eval() usage (security risk)")
         
         # Check for alert() usage (poor UX)
-        if re.search(r'\balert\s*\(', js_content):
+        if ALERT_PATTERN.search(js_content):
             result.add_warning(f"{filename}: Found alert() usage (consider better UX)")
         
-        # Check for proper semicolons (basic check)
-        lines = js_content.split('\n')
-        for i, line in enumerate(lines, 1):
-            stripped = line.strip()
-            # Skip empty lines, comments, and block statements
-            if not stripped or stripped.startswith('//') or stripped.startswith('/*') or stripped.endswith('{') or stripped.endswith('}'):
-                continue
-            # Check if line needs semicolon
-            if stripped and not stripped.endswith((';', ',', '{', '}', ')', ']')) and not stripped.startswith(('if', 'for', 'while', 'function', 'class', 'const', 'let', 'var', 'return', 'break', 'continue', 'case', 'default', 'else', '}')):
-                # This is a very basic check - many false positives possible
-                pass
-        
-        # Check for undefined variables (very basic)
-        # Look for assignments and declarations
-        declared_vars = set()
-        for match in re.finditer(r'\b(?:const|let|var)\s+(\w+)', js_content):
-            declared_vars.add(match.group(1))
-        
         # Check bracket matching
         if js_content.count('{') != js_content.count('}'):
             result.add_error(f"{filename}: Mismatched curly braces")
@@ -234,12 +382,12 @@ class Linter:
             result.add_error(f"{filename}: Mismatched curly braces in CSS (open: {open_braces}, close: {close_braces})")
         
         # Check for empty rules
-        empty_rules = re.findall(r'[^}]*\{\s*\}', css_content)
+        empty_rules = sum(1 for _ in EMPTY_CSS_RULE_PATTERN.finditer(css_content))
         if empty_rules:
-            result.add_warning(f"{filename}: Found {len(empty_rules)} empty CSS rules")
+            result.add_warning(f"{filename}: Found {empty_rules} empty CSS rules")
         
         # Check for !important overuse
-        important_count = len(re.findall(r'!important', css_content))
+        important_count = css_content.count('!important')
         if important_count > 10:
             result.add_warning(f"{filename}: High usage of !important ({important_count} occurrences) - consider refactoring")
         
@@ -271,19 +419,21 @@ class Linter:
         result.merge(parse_result)
         
         # Check for doctype
-        if not re.search(r'<!DOCTYPE\s+html>', html_content, re.IGNORECASE):
+        if not DOCTYPE_PATTERN.search(html_content):
             result.add_error("Missing <!DOCTYPE html> declaration")
         
+        lowered = self._scan_html(html_content)['lowered']
+        
         # Check for required HTML structure
-        if '<html' not in html_content.lower():
+        if '<html' not in lowered:
             result.add_error("Missing <html> tag")
-        if '<head' not in html_content.lower():
+        if '<head' not in lowered:
             result.add_error("Missing <head> tag")
-        if '<body' not in html_content.lower():
+        if '<body' not in lowered:
             result.add_error("Missing <body> tag")
         
         # Check for charset
-        if 'charset' not in html_content.lower():
+        if 'charset' not in lowered:
             result.add_warning(
                 "Missing charset declaration (e.g., <meta charset=\"UTF-8\">)",
                 category="html",
@@ -292,7 +442,7 @@ class Linter:
             )
         
         # Check for viewport meta tag (mobile-first)
-        if 'viewport' not in html_content.lower():
+        if 'viewport' not in lowered:
             result.add_warning(
                 "Missing viewport meta tag for mobile responsiveness",
                 category="html",
@@ -301,7 +451,7 @@ class Linter:
             )
         
         # Check for title
-        if '<title>' not in html_content.lower() or '</title>' not in html_content.lower():
+        if '<title>' not in lowered or '</title>' not in lowered:
             result.add_error("Missing <title> tag")
         
         return result
@@ -320,17 +470,22 @@ class Linter:
             return result
         
         # Check for script tags (security risk)
-        if re.search(r'<script[^>]*>', svg_content, re.IGNORECASE):
+        if SVG_SCRIPT_PATTERN.search(svg_content):
             result.add_error(f"{filename}: SVG contains <script> tags (security risk)")
         
         # Check for event handlers (security risk)
-        event_handlers = ['onclick', 'onload', 'onerror', 'onmouseover', 'onmouseout']
-        for handler in event_handlers:
-            if re.search(f'{handler}\\s*=', svg_content, re.IGNORECASE):
+        # One pass finds all handlers; errors keep the SVG_EVENT_HANDLERS order
+        found_handlers = set()
+        for match in SVG_EVENT_HANDLER_PATTERN.finditer(svg_content):
+            found_handlers.add(match.lastgroup)
+            if len(found_handlers) == len(SVG_EVENT_HANDLERS):
+                break
+        for handler in SVG_EVENT_HANDLERS:
+            if handler in found_handlers:
                 result.add_error(f"{filename}: SVG contains '{handler}' event handler (security risk)")
         
         # Check for external references (security risk)
-        if re.search(r'xlink:href\s*=\s*["\']https?://', svg_content, re.IGNORECASE):
+        if SVG_EXTERNAL_REF_PATTERN.search(svg_content):
             result.add_warning(f"{filename}: SVG contains external references (potential security risk)")
         
         # Check for proper SVG structure
@@ -363,19 +518,9 @@ class Linter:
                 result.add_warning(f"Translation '{lang}' missing section: {section}")
         
         # Check for empty translations
-        def check_empty_values(obj: Any, path: str = ""):
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    current_path = f"{path}.{key}" if path else key
-                    if isinstance(value, str) and not value.strip():
-                        result.add_warning(f"Translation '{lang}' has empty value at: {current_path}")
-                    elif isinstance(value, (dict, list)):
-                        check_empty_values(value, current_path)
-            elif isinstance(obj, list):
-                for i, item in enumerate(obj):
-                    check_empty_values(item, f"{path}[{i}]")
-        
-        check_empty_values(translations)
+        empty_paths, _ = self._walk_translations(translations)
+        for path in empty_paths:
+            result.add_warning(f"Translation '{lang}' has empty value at: {path}")
         
         return result
     
@@ -386,19 +531,8 @@ class Linter:
         result = LintResult()
         self.log("Checking translation consistency between en and de")
         
-        def get_keys(obj: Any, prefix: str = "") -> set:
-            """Recursively get all keys from nested dict"""
-            keys = set()
-            if isinstance(obj, dict):
-                for key, value in obj.items():
-                    current_key = f"{prefix}.{key}" if prefix else key
-                    keys.add(current_key)
-                    if isinstance(value, dict):
-                        keys.update(get_keys(value, current_key))
-            return keys
-        
-        en_keys = get_keys(trans_en)
-        de_keys = get_keys(trans_de)
+        _, en_keys = self._walk_translations(trans_en)
+        _, de_keys = self._walk_translations(trans_de)
         
         # Find missing keys
         missing_in_de = en_keys - de_keys
@@ -427,48 +561,60 @@ class Linter:
             return result
         
         # Check for lang attribute
-        if not re.search(r'<html[^>]*\slang\s*=', html_content, re.IGNORECASE):
+        if not HTML_LANG_PATTERN.search(html_content):
             result.add_error("Missing 'lang' attribute on <html> tag (WCAG 3.1.1)")
         
+        scan = self._scan_html(html_content)
+        lowered = scan['lowered']
+        
         # Check for images without alt text
-        img_tags = re.findall(r'<img[^>]*>', html_content, re.IGNORECASE)
+        img_tags = scan['img_tags']
+        missing_alt = 0
         for img in img_tags:
             if 'alt=' not in img.lower():
-                result.add_error(f"Image missing 'alt' attribute (WCAG 1.1.1)")
+                missing_alt += 1
+                if missing_alt <= MAX_PER_RULE:
+                    result.add_error(f"Image missing 'alt' attribute (WCAG 1.1.1)")
+        _add_suppressed_warning(result, missing_alt, "images missing 'alt' attribute")
         
         # Check for empty alt text on decorative images (this is actually OK)
-        decorative_imgs = re.findall(r'<img[^>]*alt\s*=\s*["\']["\'][^>]*>', html_content, re.IGNORECASE)
+        decorative_imgs = [img for img in img_tags if EMPTY_ALT_PATTERN.search(img, 4)]
         if decorative_imgs:
             self.log(f"Found {len(decorative_imgs)} images with empty alt (OK for decorative images)")
         
         # Check for links without text content
-        link_matches = re.finditer(r'<a\s+[^>]*href\s*=\s*["\'][^"\']*["\'][^>]*>(.*?)</a>', html_content, re.IGNORECASE | re.DOTALL)
-        for match in link_matches:
-            link_content = match.group(1).strip()
-            # Remove HTML tags to check text content
-            text_content = re.sub(r'<[^>]+>', '', link_content).strip()
-            if not text_content:
-                result.add_error("Link without text content (WCAG 2.4.4)")
+        empty_links = 0
+        for start, end in scan['link_spans']:
+            if not _has_visible_text(html_content[start:end]):
+                empty_links += 1
+                if empty_links <= MAX_PER_RULE:
+                    result.add_error("Link without text content (WCAG 2.4.4)")
+        _add_suppressed_warning(result, empty_links, "links without text content")
         
         # Check for form inputs without labels
-        input_tags = re.findall(r'<input[^>]*>', html_content, re.IGNORECASE)
+        input_tags = scan['input_tags']
+        unlabeled_inputs = 0
         for input_tag in input_tags:
+            input_tag = input_tag.lower()
             # Skip hidden and submit buttons
-            if 'type="hidden"' in input_tag.lower() or 'type="submit"' in input_tag.lower() or 'type="button"' in input_tag.lower():
+            if 'type="hidden"' in input_tag or 'type="submit"' in input_tag or 'type="button"' in input_tag:
                 continue
             # Check for aria-label or id (for label association)
-            if 'aria-label=' not in input_tag.lower() and 'id=' not in input_tag.lower():
+            if 'aria-label=' not in input_tag and 'id=' not in input_tag:
+                unlabeled_inputs += 1
+                if unlabeled_inputs > MAX_PER_RULE:
+                    continue
                 result.add_warning(
                     "Form input should have aria-label or associated label (WCAG 3.3.2)",
                     category="accessibility",
                     rule="WCAG 3.3.2",
                     context="Form inputs must be properly labeled for screen readers"
                 )
+        _add_suppressed_warning(result, unlabeled_inputs, "form inputs without label")
         
         # Check for proper heading hierarchy (h1, h2, h3, etc.)
-        headings = re.findall(r'<h([1-6])[^>]*>', html_content, re.IGNORECASE)
-        if headings:
-            heading_levels = [int(h) for h in headings]
+        heading_levels = scan['heading_levels']
+        if heading_levels:
             # Check if h1 exists
             if 1 not in heading_levels:
                 result.add_warning(
@@ -488,7 +634,7 @@ class Linter:
                     )
         
         # Check for ARIA attributes
-        if 'aria-' not in html_content.lower():
+        if 'aria-' not in lowered:
             result.add_warning(
                 "No ARIA attributes found - consider adding for better accessibility",
                 category="accessibility",
@@ -500,11 +646,11 @@ class Linter:
         # This would require actual color analysis - skip for now
         
         # Check for keyboard accessibility indicators
-        if 'tabindex' not in html_content.lower():
+        if 'tabindex' not in lowered:
             self.log("No tabindex found - ensure interactive elements are keyboard accessible")
         
         # Check for skip links
-        if 'skip' not in html_content.lower() or 'main-content' not in html_content.lower():
+        if 'skip' not in lowered or 'main-content' not in lowered:
             result.add_warning(
                 "Consider adding skip navigation links for keyboard users",
                 category="accessibility",
@@ -539,46 +685,56 @@ class Linter:
         Returns:
             Combined LintResult
         """
-        print("\n" + "=" * 60)
-        print("🔍 Running Linting Checks")
-        print("=" * 60)
+        # Progress goes straight to stdout when verbose; otherwise the
+        # report is collected and written once at the end
+        out = self._out = sys.stdout if self.verbose else io.StringIO()
+        
+        print("\n" + "=" * 60, file=out)
+        print("🔍 Running Linting Checks", file=out)
+        print("=" * 60, file=out)
         
         combined_result = LintResult()
         
         # Lint HTML
-        print("\n📄 Validating HTML...")
+        print("\n📄 Validating HTML...", file=out)
         html_result = self.lint_html(html_content)
         combined_result.merge(html_result)
         self._print_result(html_result, "HTML")
         
         # Lint CSS
-        print("\n🎨 Validating CSS...")
+        print("\n🎨 Validating CSS...", file=out)
         for filename, content in stylesheets.items():
-            css_result = self.lint_css(content, filename)
+            css_result = self._lint_file('css', content, filename)
             combined_result.merge(css_result)
             self._print_result(css_result, f"CSS - {filename}")
         
         # Lint JavaScript
-        print("\n📜 Validating JavaScript...")
+        print("\n📜 Validating JavaScript...", file=out)
         for filename, content in scripts.items():
-            js_result = self.lint_javascript(content, filename)
+            js_result = self._lint_file('javascript', content, filename)
             combined_result.merge(js_result)
             self._print_result(js_result, f"JS - {filename}")
         
         # Lint SVG (if provided)
         if svg_files:
-            print("\n🖼️  Validating SVG files...")
+            print("\n🖼️  Validating SVG files...", file=out)
             for filename, content in svg_files.items():
-                svg_result = self.lint_svg(content, filename)
+                svg_result = self._lint_file('svg', content, filename)
                 combined_result.merge(svg_result)
                 self._print_result(svg_result, f"SVG - {filename}")
         
         # Lint Translations (skip if not provided - i18n removed)
         if translations_en is not None and translations_de is not None:
-            print("\n🌐 Validating Translations...")
-            en_result = self.lint_translations(translations_en, "en")
-            de_result = self.lint_translations(translations_de, "de")
-            consistency_result = self.lint_translation_consistency(translations_en, translations_de)
+            print("\n🌐 Validating Translations...", file=out)
+            # Each tree is walked once for both the completeness and the
+            # consistency check
+            self._translation_walks = []
+            try:
+                en_result = self.lint_translations(translations_en, "en")
+                de_result = self.lint_translations(translations_de, "de")
+                consistency_result = self.lint_translation_consistency(translations_en, translations_de)
+            finally:
+                self._translation_walks = None
             combined_result.merge(en_result)
             combined_result.merge(de_result)
             combined_result.merge(consistency_result)
@@ -586,283 +742,51 @@ class Linter:
             self._print_result(de_result, "Translations - DE")
             self._print_result(consistency_result, "Translation Consistency")
         else:
-            print("\n🌐 Skipping Translation Validation (i18n removed)")
+            print("\n🌐 Skipping Translation Validation (i18n removed)", file=out)
         
         # Lint Accessibility
-        print("\n♿ Validating Accessibility...")
+        print("\n♿ Validating Accessibility...", file=out)
         a11y_result = self.lint_accessibility(html_content)
         combined_result.merge(a11y_result)
         self._print_result(a11y_result, "Accessibility")
         
         # Print summary
-        print("\n" + "=" * 60)
+        print("\n" + "=" * 60, file=out)
         if combined_result.passed:
-            print("✅ All linting checks passed!")
+            print("✅ All linting checks passed!", file=out)
         else:
-            print("❌ Linting checks failed")
-            print(f"   Errors: {len(combined_result.errors)}")
+            print("❌ Linting checks failed", file=out)
+            print(f"   Errors: {len(combined_result.errors)}", file=out)
         if combined_result.warnings:
-            print(f"   Warnings: {len(combined_result.warnings)}")
-        print("=" * 60)
+            print(f"   Warnings: {len(combined_result.warnings)}", file=out)
+        print("=" * 60, file=out)
+        
+        if self.file_cache is not None:
+            try:
+                self.file_cache.save()
+            except OSError as e:
+                print(f"   Warning: Could not save lint cache: {e}", file=self._out)
+        
+        if out is not sys.stdout:
+            # One write for the whole report instead of one per line
+            sys.stdout.write(out.getvalue())
+        self._out = None
         
         return combined_result
     
     def _print_result(self, result: LintResult, name: str):
         """Print individual lint result"""
         if result.passed and not result.warnings:
-            print(f"  ✓ {name}")
+            print(f"  ✓ {name}", file=self._out)
         elif result.passed and result.warnings:
-            print(f"  ⚠ {name} ({len(result.warnings)} warnings)")
+            print(f"  ⚠ {name} ({len(result.warnings)} warnings)", file=self._out)
             if self.verbose:
                 for warning in result.warnings:
-                    print(f"      Warning: {warning}")
+                    print(f"      Warning: {warning}", file=self._out)
         else:
-            print(f"  ✗ {name} ({len(result.errors)} errors, {len(result.warnings)} warnings)")
+            print(f"  ✗ {name} ({len(result.errors)} errors, {len(result.warnings)} warnings)", file=self._out)
             if self.verbose:
                 for error in result.errors:
-                    print(f"      Error: {error}")
+                    print(f"      Error: {error}", file=self._out)
                 for warning in result.warnings:
-                    print(f"      Warning: {warning}")
-    
-    # ==================== Component-Specific Linting ====================
-    
-    def lint_component(self, component_html: str, component_name: str) -> LintResult:
-        """
-        Lint an individual component template.
-        
-        Validates:
-        - Valid HTML structure
-        - Proper use of template variables
-        - Semantic HTML tags
-        - ARIA attributes
-        
-        Args:
-            component_html: Component template content
-            component_name: Name of component for error messages
-        
-        Returns:
-            LintResult with validation results
-        """
-        result = LintResult()
-        
-        # Check for template variables (should have {var_name} placeholders)
-        template_vars = re.findall(r'\{(\w+)\}', component_html)
-        if self.verbose:
-            print(f"  Component '{component_name}' uses {len(template_vars)} template variables")
-        
-        # Validate semantic tags based on component type
-        if 'map-main' in component_name:
-            if '<main' not in component_html:
-                result.add_error(f"{component_name}: Should use <main> semantic tag")
-            if 'role="application"' not in component_html:
-                result.add_warning(f"{component_name}: Missing application role for map")
-        
-        elif 'dashboard-aside' in component_name:
-            if '<aside' not in component_html:
-                result.add_error(f"{component_name}: Should use <aside> semantic tag")
-            if 'role="complementary"' not in component_html:
-                result.add_warning(f"{component_name}: Missing complementary role")
-        
-        elif 'filter-nav' in component_name:
-            if '<nav' not in component_html:
-                result.add_error(f"{component_name}: Should use <nav> semantic tag")
-            if 'role="navigation"' not in component_html:
-                result.add_warning(f"{component_name}: Missing navigation role")
-        
-        # Check for ARIA labels on interactive elements
-        if 'button' in component_html or 'role="button"' in component_html:
-            if 'aria-label=' not in component_html:
-                result.add_warning(f"{component_name}: Interactive elements should have aria-label")
-        
-        return result
-    
-    def lint_all_components(self, components_dir: Path) -> LintResult:
-        """
-        Lint all components in a directory.
-        
-        Args:
-            components_dir: Path to components directory
-        
-        Returns:
-            Combined LintResult for all components
-        """
-        result = LintResult()
-        
-        if not components_dir.exists():
-            result.add_error(f"Components directory not found: {components_dir}")
-            return result
-        
-        # Find all HTML component files
-        component_files = list(components_dir.rglob('*.html'))
-        
-        if not component_files:
-            result.add_warning(f"No component files found in {components_dir}")
-            return result
-        
-        print(f"\n🧩 Linting {len(component_files)} components...")
-        
-        for component_file in component_files:
-            relative_path = component_file.relative_to(components_dir)
-            try:
-                content = component_file.read_text(encoding='utf-8')
-                component_result = self.lint_component(content, str(relative_path))
-                result.merge(component_result)
-                
-                if component_result.passed and not component_result.warnings:
-                    print(f"  ✓ {relative_path}")
-                elif component_result.passed:
-                    print(f"  ⚠ {relative_path} ({len(component_result.warnings)} warnings)")
-                else:
-                    print(f"  ✗ {relative_path} ({len(component_result.errors)} errors)")
-            except Exception as e:
-                result.add_error(f"Failed to lint {relative_path}: {e}")
-        
-        return result
-    
-    def lint_design_tokens(self, design_config: Dict) -> LintResult:
-        """
-        Validate design token structure from config.
-        
-        Validates:
-        - Required sections present
-        - Color values are valid hex
-        - Spacing values have units
-        - Z-index values are integers
-        
-        Args:
-            design_config: Design section from config.json
-        
-        Returns:
-            LintResult with validation results
-        """
-        result = LintResult()
-        
-        if not design_config:
-            result.add_error("No design configuration provided")
-            return result
-        
-        # Check required sections
-        required_sections = ['colors', 'typography', 'spacing', 'z_index',
-                           'shadows', 'borders', 'transitions', 'branding']
-        
-        for section in required_sections:
-            if section not in design_config:
-                result.add_warning(f"Missing design section: {section}")
-        
-        # Validate colors
-        if 'colors' in design_config:
-            colors = design_config['colors']
-            hex_pattern = re.compile(r'^#[0-9A-Fa-f]{3}([0-9A-Fa-f]{3})?$')
-            
-            for key, value in colors.items():
-                if not hex_pattern.match(value):
-                    result.add_warning(f"Color '{key}' has invalid hex value: {value}")
-            
-            # Check required colors
-            required_colors = ['primary', 'bg_primary', 'text_primary']
-            for color in required_colors:
-                if color not in colors:
-                    result.add_error(f"Missing required color: {color}")
-        
-        # Validate spacing
-        if 'spacing' in design_config:
-            spacing = design_config['spacing']
-            unit_pattern = re.compile(r'^\d+(\.\d+)?(px|rem|em|%)$')
-            
-            for key, value in spacing.items():
-                if not unit_pattern.match(value):
-                    result.add_warning(f"Spacing '{key}' missing unit: {value}")
-        
-        # Validate z-index
-        if 'z_index' in design_config:
-            z_index = design_config['z_index']
-            
-            for key, value in z_index.items():
-                if key.startswith('_'):  # Skip comment keys
-                    continue
-                if not isinstance(value, int):
-                    result.add_error(f"Z-index '{key}' must be integer: {value}")
-            
-            # Validate layer ordering
-            if all(k in z_index for k in ['layer_1_map', 'layer_2_event_popups', 
-                                          'layer_3_ui', 'layer_4_modals']):
-                if not (z_index['layer_1_map'] < z_index['layer_2_event_popups'] < 
-                       z_index['layer_3_ui'] < z_index['layer_4_modals']):
-                    result.add_error("Z-index layers not in correct order (1 < 2 < 3 < 4)")
-        
-        return result
-    
-    def lint_semantic_structure(self, html: str) -> LintResult:
-        """
-        Validate semantic HTML5 structure.
-        
-        Checks for:
-        - Proper use of landmark elements
-        - ARIA roles match semantic tags
-        - Heading hierarchy
-        - Required ARIA attributes
-        
-        Args:
-            html: Complete HTML document
-        
-        Returns:
-            LintResult with validation results
-        """
-        result = LintResult()
-        
-        # Check for semantic landmarks
-        landmarks = {
-            '<main': 'main',
-            '<nav': 'navigation',
-            '<aside': 'complementary content',
-            '<header': 'header',
-            '<footer': 'footer'
-        }
-        
-        for tag, description in landmarks.items():
-            if tag in html:
-                if self.verbose:
-                    print(f"  ✓ Found {description} landmark")
-            else:
-                if tag == '<main':  # main is required
-                    result.add_error(f"Missing required {description} landmark")
-        
-        # Check for ARIA roles matching semantic tags
-        if '<main' in html and 'role="application"' not in html and 'role="main"' not in html:
-            result.add_warning("Main element should have appropriate ARIA role")
-        
-        if '<nav' in html and 'role="navigation"' not in html:
-            result.add_warning("Nav element missing navigation role")
-        
-        if '<aside' in html and 'role="complementary"' not in html:
-            result.add_warning("Aside element missing complementary role")
-        
-        # Check heading hierarchy
-        headings = re.findall(r'<h([1-6])', html)
-        if headings:
-            heading_levels = [int(h) for h in headings]
-            # Check if hierarchy starts at 1 and doesn't skip levels
-            if heading_levels[0] != 1:
-                result.add_warning(f"Heading hierarchy should start with h1, found h{heading_levels[0]}")
-            
-            for i in range(1, len(heading_levels)):
-                if heading_levels[i] > heading_levels[i-1] + 1:
-                    result.add_warning(f"Heading hierarchy skips level: h{heading_levels[i-1]} to h{heading_levels[i]}")
-        
-        # Check for live regions
-        if 'aria-live=' in html:
-            if self.verbose:
-                print("  ✓ Found ARIA live regions")
-        
-        # Check for proper button labels
-        button_pattern = re.compile(r'<button[^>]*>', re.IGNORECASE)
-        buttons = button_pattern.findall(html)
-        for button in buttons:
-            if 'aria-label=' not in button and '>' in button:
-                # Check if button has text content
-                button_end = html.find('</button>', html.find(button))
-                button_content = html[html.find(button):button_end]
-                if not re.search(r'>[^<]+<', button_content):
-                    result.add_warning("Button should have aria-label or text content")
-        
-        return result
+                    print(f"      Warning: {warning}", file=self._out)
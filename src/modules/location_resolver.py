@@ -7,7 +7,10 @@ by scraping event detail pages for actual location information.
 
 import json
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
@@ -16,12 +19,44 @@ logger = logging.getLogger(__name__)
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     from bs4 import BeautifulSoup
+    import lxml  # noqa: F401 - parser backend used for all detail pages
     SCRAPING_ENABLED = True
 except ImportError:
     SCRAPING_ENABLED = False
     logger.warning("Scraping libraries not installed. Location resolution will be limited.")
 
+# Detail pages fetched at once (they mostly come from one host, so kept low)
+RESOLVE_WORKERS = 8
+
+# Detail page bytes read before parsing (far above a normal event page);
+# the rest of a larger page is not downloaded
+MAX_PAGE_BYTES = 1_000_000
+
+# Bump when location extraction changes so cached page results are rebuilt
+PAGE_CACHE_VERSION = 1
+
+# Detail page patterns, compiled once at import
+# Explicit location labels: "Ort:", "Veranstaltungsort:", "Location:", etc.
+LOCATION_LABEL_PATTERNS = [
+    re.compile(r'(?:Ort|Veranstaltungsort|Location|Venue):\s*(.+)', re.IGNORECASE),
+    re.compile(r'Wo:\s*(.+)', re.IGNORECASE),
+]
+COMMA_SUFFIX_PATTERN = re.compile(r'\s*,.*$')
+PIPE_SUFFIX_PATTERN = re.compile(r'\s*\|.*$')
+SCHEMA_EVENT_PATTERN = re.compile(r'schema\.org/Event', re.IGNORECASE)
+VENUE_CLASS_PATTERN = re.compile(r'(location|venue|ort|veranstaltungsort)', re.IGNORECASE)
+# Location names too generic to place an event; resolved from detail pages
+GENERIC_LOCATIONS = frozenset({'Hof', 'Frankenpost'})
+# Table row labels naming the venue cell next to them
+LOCATION_LABEL_KEYWORDS = ('ort', 'location', 'venue', 'wo')
+ADDRESS_PATTERNS = [
+    re.compile(r'([A-ZÄÖÜ][a-zäöüß]+(?:straße|str\.|weg|platz|allee))\s+\d+'),
+    re.compile(r'\d{5}\s+[A-ZÄÖÜ][a-zäöüß]+'),  # PLZ + Stadt
+]
+
 
 class LocationResolver:
     """
@@ -42,14 +77,104 @@ class LocationResolver:
         self.base_path = Path(base_path)
         self.config = config
         self.session = None
+        # Detail page results by URL: {'etag', 'last_modified', 'location'},
+        # revalidated with conditional requests
+        self.page_cache_file = self.base_path / '.cache' / 'location_pages.json'
+        self.page_cache = self._load_page_cache()
+        self._page_cache_changed = False
+        self.pending_file = self.base_path / 'assets' / 'json' / 'pending_events.json'
+        # Pending events shared by resolve_single_event calls inside batch()
+        self._batch_data = None
+        self._batch_changed = False
         
         if SCRAPING_ENABLED:
             self.session = requests.Session()
             self.session.headers.update({
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             })
+            # Keep one reusable connection per fetch thread and retry
+            # transient server errors with backoff
+            retry = Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=['GET']
+            )
+            adapter = HTTPAdapter(pool_maxsize=RESOLVE_WORKERS, max_retries=retry)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
             self.timeout = 15
     
+    def _load_page_cache(self) -> Dict[str, Dict]:
+        """Load cached detail page results (empty if missing/invalid)"""
+        try:
+            with open(self.page_cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if cache.get('version') != PAGE_CACHE_VERSION:
+            return {}
+        return cache.get('entries', {})
+    
+    def _save_page_cache(self, pending_data: Optional[Dict] = None):
+        """
+        Write cached detail page results atomically (if any changed).
+        
+        Args:
+            pending_data: Pending events; entries for pages no event links to
+                anymore (e.g. approved or rejected since) are dropped
+        """
+        if pending_data is not None:
+            urls = {event.get('url') for event in pending_data.get('pending_events', [])}
+            stale = [url for url in self.page_cache if url not in urls]
+            for url in stale:
+                del self.page_cache[url]
+            if stale:
+                self._page_cache_changed = True
+        if not self._page_cache_changed:
+            return
+        try:
+            self.page_cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.page_cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'version': PAGE_CACHE_VERSION, 'entries': self.page_cache}, f, ensure_ascii=False)
+            os.replace(tmp_file, self.page_cache_file)
+            self._page_cache_changed = False
+        except OSError as e:
+            logger.warning(f"Could not save location page cache: {e}")
+    
+    def _save_pending(self, pending_data: Dict):
+        """Write pending events back to pending_events.json"""
+        with open(self.pending_file, 'w', encoding='utf-8') as f:
+            json.dump(pending_data, f, indent=2, ensure_ascii=False)
+    
+    @contextmanager
+    def batch(self):
+        """
+        Resolve several single events with one read and one write.
+        
+        Inside the block, resolve_single_event works on pending events
+        loaded once; changes are written when the block exits.
+        
+        Usage:
+            with resolver.batch():
+                for event_id in event_ids:
+                    resolver.resolve_single_event(event_id)
+        """
+        if self.pending_file.exists():
+            with open(self.pending_file, 'r', encoding='utf-8') as f:
+                self._batch_data = json.load(f)
+        self._batch_changed = False
+        try:
+            yield self
+        finally:
+            if self._batch_changed:
+                self._save_pending(self._batch_data)
+            self._save_page_cache(self._batch_data)
+            self._batch_data = None
+            self._batch_changed = False
+    
     def resolve_pending_events(self, dry_run: bool = False) -> Dict:
         """
         Resolve generic locations for all pending events.
@@ -74,7 +199,7 @@ class LocationResolver:
             }
         
         # Load pending events
-        pending_file = self.base_path / 'assets' / 'json' / 'pending_events.json'
+        pending_file = self.pending_file
         if not pending_file.exists():
             logger.warning("No pending events file found")
             return {'total_checked': 0, 'resolved_count': 0, 'failed_count': 0}
@@ -85,10 +210,9 @@ class LocationResolver:
         events = pending_data.get('pending_events', [])
         
         # Find events with generic locations
-        generic_locations = ['Hof', 'Frankenpost']
         events_to_resolve = [
             event for event in events
-            if event.get('location', {}).get('name') in generic_locations
+            if event.get('location', {}).get('name') in GENERIC_LOCATIONS
         ]
         
         logger.info(f"Found {len(events_to_resolve)} events with generic locations")
@@ -97,6 +221,17 @@ class LocationResolver:
         failed_count = 0
         results = []
         
+        # Detail pages are fetched and parsed on a thread pool, since this is
+        # mostly waiting on HTTP; results are applied below in event order.
+        # Events sharing a detail page (e.g. series dates) share one fetch
+        executor = ThreadPoolExecutor(max_workers=RESOLVE_WORKERS)
+        fetches = {}
+        for event in events_to_resolve:
+            url = event.get('url')
+            if url and url not in fetches:
+                fetches[url] = executor.submit(self._extract_location_from_url, url)
+        executor.shutdown(wait=False)
+        
         for event in events_to_resolve:
             event_id = event.get('id')
             title = event.get('title', 'Unknown')[:50]
@@ -111,14 +246,14 @@ class LocationResolver:
             logger.info(f"Resolving location for: {title}...")
             
             try:
-                # Fetch and parse detail page
-                new_location = self._extract_location_from_url(url)
+                # Wait for the detail page
+                new_location = fetches[url].result()
                 
                 if new_location and new_location.get('name'):
                     venue_name = new_location['name']
                     
                     # Skip if location is still generic
-                    if venue_name in generic_locations:
+                    if venue_name in GENERIC_LOCATIONS:
                         logger.debug(f"  Still generic: {venue_name}")
                         failed_count += 1
                         continue
@@ -149,10 +284,11 @@ class LocationResolver:
                 logger.debug(f"  ✗ Error: {e}")
                 failed_count += 1
         
+        self._save_page_cache(pending_data)
+        
         # Save updated pending events (if not dry run and changes were made)
         if not dry_run and resolved_count > 0:
-            with open(pending_file, 'w', encoding='utf-8') as f:
-                json.dump(pending_data, f, indent=2, ensure_ascii=False)
+            self._save_pending(pending_data)
             logger.info(f"✓ Updated {resolved_count} events in pending_events.json")
         
         # Print summary
@@ -193,12 +329,43 @@ class LocationResolver:
             return None
         
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'lxml')
+            # Revalidate a cached page: a 304 reuses its extracted location
+            cached = self.page_cache.get(url)
+            headers = {}
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+            
+            # Streamed, so the body is only downloaded for HTML pages
+            with self.session.get(url, timeout=self.timeout, headers=headers, stream=True) as response:
+                if cached and response.status_code == 304:
+                    return dict(cached['location']) if cached['location'] else None
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', '').lower()
+                if content_type and 'html' not in content_type:
+                    # PDFs, images, etc. linked as the event page
+                    location = None
+                else:
+                    # Decode with the charset the server declared, so BeautifulSoup
+                    # skips encoding detection. Without one, requests reports
+                    # ISO-8859-1 for any text/* response, so that is not trusted
+                    from_encoding = response.encoding if 'charset=' in content_type else None
+                    soup = BeautifulSoup(self._read_page(response), 'lxml', from_encoding=from_encoding)
+                    
+                    # Try different extraction strategies
+                    location = self._extract_location_frankenpost(soup)
             
-            # Try different extraction strategies
-            location = self._extract_location_frankenpost(soup)
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self.page_cache[url] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'location': location
+                }
+                self._page_cache_changed = True
             
             return location
             
@@ -206,6 +373,18 @@ class LocationResolver:
             logger.debug(f"Failed to fetch {url}: {e}")
             return None
     
+    def _read_page(self, response) -> bytes:
+        """Read a streamed response body, up to MAX_PAGE_BYTES"""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= MAX_PAGE_BYTES:
+                logger.debug(f"Page larger than {MAX_PAGE_BYTES} bytes, truncated: {response.url}")
+                break
+        return b''.join(chunks)[:MAX_PAGE_BYTES]
+    
     def _extract_location_frankenpost(self, soup: BeautifulSoup) -> Optional[Dict]:
         """
         Extract location from Frankenpost event detail page.
@@ -218,45 +397,47 @@ class LocationResolver:
         """
         location = {'name': None, 'address': None}
         
-        # Strategy 1: Look for explicit location/venue fields
-        # Common patterns: "Ort:", "Veranstaltungsort:", "Location:", etc.
-        location_patterns = [
-            r'(?:Ort|Veranstaltungsort|Location|Venue):\s*(.+)',
-            r'Wo:\s*(.+)',
-        ]
-        
-        text = soup.get_text()
-        for pattern in location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                venue = match.group(1).strip()
-                # Clean up common suffixes
-                venue = re.sub(r'\s*,.*$', '', venue)  # Remove everything after comma
-                venue = re.sub(r'\s*\|.*$', '', venue)  # Remove everything after pipe
-                if venue and len(venue) > 2:
-                    location['name'] = venue
-                    break
-        
+        # Structured data is checked first: its venue name takes precedence
+        # over the text labels of Strategy 1, so the whole document's text
+        # is only built when there is no such name
         # Strategy 2: Look for structured data (schema.org, microdata)
         # Check for itemtype="http://schema.org/Event"
-        event_schema = soup.find(attrs={'itemtype': re.compile(r'schema\.org/Event', re.I)})
+        schema_name = None
+        event_schema = soup.find(attrs={'itemtype': SCHEMA_EVENT_PATTERN})
         if event_schema:
             venue_elem = event_schema.find(attrs={'itemprop': 'location'})
             if venue_elem:
                 venue_name = venue_elem.find(attrs={'itemprop': 'name'})
                 if venue_name:
-                    location['name'] = venue_name.get_text().strip()
+                    schema_name = venue_name.get_text().strip()
                 
                 venue_address = venue_elem.find(attrs={'itemprop': 'address'})
                 if venue_address:
                     location['address'] = venue_address.get_text().strip()
         
+        text = None
+        if schema_name is not None:
+            location['name'] = schema_name
+        else:
+            # Strategy 1: Look for explicit location/venue fields
+            text = soup.get_text()
+            for pattern in LOCATION_LABEL_PATTERNS:
+                match = pattern.search(text)
+                if match:
+                    venue = match.group(1).strip()
+                    # Clean up common suffixes
+                    venue = COMMA_SUFFIX_PATTERN.sub('', venue)  # Remove everything after comma
+                    venue = PIPE_SUFFIX_PATTERN.sub('', venue)  # Remove everything after pipe
+                    if venue and len(venue) > 2:
+                        location['name'] = venue
+                        break
+        
         # Strategy 3: Look for common HTML structures
         # div/span with class containing "location", "venue", "ort"
         if not location['name']:
             venue_elems = soup.find_all(
                 ['div', 'span', 'p', 'td', 'th'],
-                class_=re.compile(r'(location|venue|ort|veranstaltungsort)', re.I)
+                class_=VENUE_CLASS_PATTERN
             )
             for elem in venue_elems:
                 text = elem.get_text().strip()
@@ -268,10 +449,11 @@ class LocationResolver:
         # Strategy 4: Look for table rows with location labels
         if not location['name']:
             for row in soup.find_all('tr'):
-                cells = row.find_all(['td', 'th'])
+                # Only the first two cells are read: stop the search there
+                cells = row.find_all(['td', 'th'], limit=2)
                 if len(cells) >= 2:
                     label = cells[0].get_text().strip().lower()
-                    if any(keyword in label for keyword in ['ort', 'location', 'venue', 'wo']):
+                    if any(keyword in label for keyword in LOCATION_LABEL_KEYWORDS):
                         venue = cells[1].get_text().strip()
                         if venue and len(venue) > 2 and venue not in ['Hof', 'Frankenpost']:
                             location['name'] = venue
@@ -279,14 +461,10 @@ class LocationResolver:
         
         # Strategy 5: Look for address information
         if not location['address']:
-            # Common address patterns
-            address_patterns = [
-                r'([A-ZÄÖÜ][a-zäöüß]+(?:straße|str\.|weg|platz|allee))\s+\d+',
-                r'\d{5}\s+[A-ZÄÖÜ][a-zäöüß]+',  # PLZ + Stadt
-            ]
-            
-            for pattern in address_patterns:
-                match = re.search(pattern, text)
+            if text is None:
+                text = soup.get_text()
+            for pattern in ADDRESS_PATTERNS:
+                match = pattern.search(text)
                 if match:
                     location['address'] = match.group(0)
                     break
@@ -307,13 +485,14 @@ class LocationResolver:
         if not SCRAPING_ENABLED:
             return {'error': 'Missing dependencies'}
         
-        # Load pending events
-        pending_file = self.base_path / 'assets' / 'json' / 'pending_events.json'
-        if not pending_file.exists():
+        # Load pending events (already loaded inside batch())
+        if self._batch_data is not None:
+            pending_data = self._batch_data
+        elif not self.pending_file.exists():
             return {'error': 'No pending events file found'}
-        
-        with open(pending_file, 'r', encoding='utf-8') as f:
-            pending_data = json.load(f)
+        else:
+            with open(self.pending_file, 'r', encoding='utf-8') as f:
+                pending_data = json.load(f)
         
         events = pending_data.get('pending_events', [])
         event = next((e for e in events if e.get('id') == event_id), None)
@@ -329,6 +508,8 @@ class LocationResolver:
         
         try:
             new_location = self._extract_location_from_url(url)
+            if self._batch_data is None:
+                self._save_page_cache(pending_data)
             
             if new_location and new_location.get('name'):
                 venue_name = new_location['name']
@@ -348,8 +529,10 @@ class LocationResolver:
                     if new_location.get('address'):
                         event['location']['address'] = new_location['address']
                     
-                    with open(pending_file, 'w', encoding='utf-8') as f:
-                        json.dump(pending_data, f, indent=2, ensure_ascii=False)
+                    if self._batch_data is not None:
+                        self._batch_changed = True
+                    else:
+                        self._save_pending(pending_data)
                 
                 return result
             else:
@@ -38,7 +38,7 @@ try:
 except ImportError:
     # Fallback if linter is not available
     class Linter:
-        def __init__(self, verbose=False):
+        def __init__(self, verbose=False, cache_file=None):
             pass
         def lint_all(self, *args, **kwargs):
             class FakeLintResult:
@@ -118,6 +118,15 @@ class SiteGenerator:
         # Debug comments detection with force override support
         # Priority: 1) Environment variable, 2) Config file, 3) Auto-detection
         self.enable_debug_comments = self._detect_debug_comments()
+        
+        # Component templates by filename, read together on first use. A
+        # generator lives for one build, so components aren't re-checked
+        self._components = None
+        
+        # DEBUG_INFO dict (and its embedded JSON text) from the last
+        # build_html_from_components call
+        self._debug_info = None
+        self._debug_info_json = None
     
     def _detect_debug_comments(self) -> bool:
         """
@@ -1301,8 +1310,17 @@ window.DASHBOARD_ICONS = {json.dumps(DASHBOARD_ICONS_MAP, ensure_ascii=False)};'
         Example:
             html_head = self.load_component('html-head.html')
         """
-        full_path = self.base_path / 'assets' / 'html' / component_path
-        if not full_path.exists():
+        components_dir = self.base_path / 'assets' / 'html'
+        full_path = components_dir / component_path
+        
+        if self._components is None:
+            self._components = {
+                p.name: p.read_text(encoding='utf-8')
+                for p in components_dir.glob('*.html')
+            }
+        
+        content = self._components.get(component_path)
+        if content is None:
             raise FileNotFoundError(
                 f"Component not found: {full_path}\n"
                 f"Available components should be in assets/html/:\n"
@@ -1313,7 +1331,7 @@ window.DASHBOARD_ICONS = {json.dumps(DASHBOARD_ICONS_MAP, ensure_ascii=False)};'
                 f"  - dashboard-aside.html\n"
                 f"  - filter-nav.html"
             )
-        return full_path.read_text(encoding='utf-8')
+        return content
     
     def load_design_tokens(self) -> Dict:
         """
@@ -1789,6 +1807,7 @@ window.DASHBOARD_ICONS = {json.dumps(DASHBOARD_ICONS_MAP, ensure_ascii=False)};'
         
         # Calculate debug information
         debug_info = self.calculate_debug_info(primary_config, events)
+        self._debug_info = debug_info
         
         # Prepare embedded data for frontend with debug comments
         # All data is embedded by backend - frontend does NOT fetch config.json or events
@@ -1801,6 +1820,7 @@ window.DASHBOARD_ICONS = {json.dumps(DASHBOARD_ICONS_MAP, ensure_ascii=False)};'
         marker_icons_json = json.dumps(marker_icons, ensure_ascii=False, indent=2 if self.enable_debug_comments else None)
         dashboard_icons_json = json.dumps(DASHBOARD_ICONS_MAP, ensure_ascii=False, indent=2 if self.enable_debug_comments else None)
         debug_info_json = json.dumps(debug_info, ensure_ascii=False, indent=2 if self.enable_debug_comments else None)
+        self._debug_info_json = debug_info_json
         
         # Wrap each data section with debug comments
         if self.enable_debug_comments:
@@ -2013,7 +2033,7 @@ window.DEBUG_INFO = {debug_info_json};'''
         lint_data = None  # Initialize lint data for DEBUG_INFO
         if not skip_lint:
             print("\n🔍 Linting generated content...")
-            linter = Linter(verbose=False)
+            linter = Linter(verbose=False, cache_file=self.base_path / '.cache' / 'lint_cache.json')
             
             # Collect SVG files for linting
             svg_files = {}
@@ -2102,23 +2122,29 @@ window.DEBUG_INFO = {debug_info_json};'''
         debug_info_marker = 'window.DEBUG_INFO = '
         debug_info_start = html_de.find(debug_info_marker)
         if debug_info_start != -1:
-            debug_info_end = html_de.find('};', debug_info_start)
-            if debug_info_end != -1:
-                # Extract current DEBUG_INFO
-                current_debug_json = html_de[debug_info_start + len(debug_info_marker):debug_info_end + 1]
-                try:
-                    debug_data = json.loads(current_debug_json)
-                    debug_data['html_sizes'] = html_sizes
-                    debug_data['language'] = 'de'
-                    # Add lint results if available
-                    if lint_data:
-                        debug_data['lint_results'] = lint_data
-                        print(f"✅ Embedded {len(lint_data.get('structured_warnings', []))} lint warnings in DEBUG_INFO")
-                    # Replace with updated DEBUG_INFO
-                    updated_debug_json = json.dumps(debug_data, ensure_ascii=False)
-                    html_de = html_de[:debug_info_start + len(debug_info_marker)] + updated_debug_json + html_de[debug_info_end + 1:]
-                except Exception as e:
-                    logger.warning(f"Could not update DEBUG_INFO: {e}")
+            json_start = debug_info_start + len(debug_info_marker)
+            try:
+                if (self._debug_info is not None
+                        and html_de.startswith(self._debug_info_json, json_start)):
+                    # Update the dict that was embedded instead of parsing it
+                    # back out of the page; its JSON text gives the exact end
+                    debug_data = self._debug_info
+                    debug_info_end = json_start + len(self._debug_info_json)
+                else:
+                    # Extract current DEBUG_INFO (parsing validates the end)
+                    debug_info_end = html_de.find('};', json_start) + 1
+                    debug_data = json.loads(html_de[json_start:debug_info_end])
+                debug_data['html_sizes'] = html_sizes
+                debug_data['language'] = 'de'
+                # Add lint results if available
+                if lint_data:
+                    debug_data['lint_results'] = lint_data
+                    print(f"✅ Embedded {len(lint_data.get('structured_warnings', []))} lint warnings in DEBUG_INFO")
+                # Replace with updated DEBUG_INFO
+                updated_debug_json = json.dumps(debug_data, ensure_ascii=False)
+                html_de = html_de[:json_start] + updated_debug_json + html_de[debug_info_end:]
+            except Exception as e:
+                logger.warning(f"Could not update DEBUG_INFO: {e}")
         
         print(f"✅ Injected HTML size breakdown into DEBUG_INFO")
         
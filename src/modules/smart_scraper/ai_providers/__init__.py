@@ -1,8 +1,10 @@
 """AI Providers - Multiple AI backends for content extraction."""
 
 import importlib
+import logging
 from typing import Dict, Any
 
+logger = logging.getLogger(__name__)
 
 # Provider registry: name -> (module, class_name)
 PROVIDER_REGISTRY = {
@@ -16,6 +18,9 @@ PROVIDER_REGISTRY = {
     'local_llm': ('local_llm', 'LocalLLMProvider'),
 }
 
+# Provider classes by name, resolved once (None if the import failed)
+_CLASS_CACHE: Dict[str, Any] = {}
+
 
 def _load_provider(name: str, module_name: str, class_name: str, provider_config: Dict[str, Any]):
     """Load a single AI provider.
@@ -29,10 +34,19 @@ def _load_provider(name: str, module_name: str, class_name: str, provider_config
     Returns:
         Provider instance or None if import fails
     """
+    if name not in _CLASS_CACHE:
+        try:
+            # Use importlib.import_module for proper relative imports (recommended over __import__)
+            module = importlib.import_module(f'.{module_name}', package=__package__)
+            _CLASS_CACHE[name] = getattr(module, class_name)
+        except (ImportError, AttributeError) as e:
+            logger.warning(f"AI provider '{name}' unavailable: {e}")
+            _CLASS_CACHE[name] = None
+    
+    provider_class = _CLASS_CACHE[name]
+    if provider_class is None:
+        return None
     try:
-        # Use importlib.import_module for proper relative imports (recommended over __import__)
-        module = importlib.import_module(f'.{module_name}', package=__package__)
-        provider_class = getattr(module, class_name)
         return provider_class(provider_config)
     except (ImportError, AttributeError):
         return None
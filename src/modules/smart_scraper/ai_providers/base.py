@@ -70,6 +70,9 @@ class RateLimiter:
 class BaseAIProvider(ABC):
     """Abstract base class for AI providers."""
     
+    # Only the Ollama and local LLM providers declare __slots__ as well
+    __slots__ = ('config', 'rate_limiter')
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize provider.
         
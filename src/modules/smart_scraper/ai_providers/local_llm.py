@@ -7,6 +7,8 @@ from .ollama import OllamaProvider
 class LocalLLMProvider(OllamaProvider):
     """Local LLM provider using Ollama for event detail extraction."""
 
+    __slots__ = ()
+
     def extract_event_info(self, text: str, prompt: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Extract event information from text using local LLM.
@@ -17,12 +17,22 @@ logger = logging.getLogger(__name__)
 class OllamaProvider(BaseAIProvider):
     """Ollama local LLM provider for event categorization."""
     
+    __slots__ = ('host', 'model', 'timeout', '_available')
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.host = config.get('host', 'http://localhost:11434')
         self.model = config.get('model', 'llama3.2')
         self.timeout = config.get('timeout', 30)
-        self.available = REQUESTS_AVAILABLE and self._check_connection()
+        # Connection is checked on first use, not for every configured provider
+        self._available = None
+    
+    @property
+    def available(self) -> bool:
+        """Whether Ollama is reachable (checked once)."""
+        if self._available is None:
+            self._available = REQUESTS_AVAILABLE and self._check_connection()
+        return self._available
     
     def _check_connection(self) -> bool:
         """Check if Ollama is running."""
@@ -93,6 +93,11 @@ class SourceOptions:
 class BaseSource(ABC):
     """Abstract base class for all source scrapers."""
     
+    # Subclasses that declare their own __slots__ get no per-instance __dict__;
+    # subclasses without __slots__ keep one and may set any attribute
+    __slots__ = ('source_config', 'options', 'name', 'url', 'source_type',
+                 'base_path', 'ai_providers')
+    
     def __init__(self, source_config: Dict[str, Any], options: SourceOptions,
                  base_path: Optional[Path] = None,
                  ai_providers: Optional[Dict[str, Any]] = None):
@@ -14,6 +14,17 @@ RELATIVE_OFFSETS = [
     ('heute', 0)
 ]
 
+# Whole-word pattern per relative phrase, compiled once at import
+RELATIVE_OFFSET_PATTERNS = [
+    (re.compile(rf'\b{re.escape(phrase)}\b'), offset)
+    for phrase, offset in RELATIVE_OFFSETS
+]
+
+TIME_PATTERNS = [
+    re.compile(r'(\d{1,2})[:\.](\d{2})\s*(?:uhr)?'),
+    re.compile(r'(\d{1,2})\s*uhr'),
+]
+
 
 def resolve_relative_date(text: str, base_date: Optional[datetime] = None) -> Optional[datetime]:
     """Resolve relative date expressions like 'tomorrow' into a date."""
@@ -23,8 +34,8 @@ def resolve_relative_date(text: str, base_date: Optional[datetime] = None) -> Op
     text_lower = text.lower()
     base_date = base_date or datetime.now()
     
-    for phrase, offset in RELATIVE_OFFSETS:
-        if re.search(rf'\b{re.escape(phrase)}\b', text_lower):
+    for pattern, offset in RELATIVE_OFFSET_PATTERNS:
+        if pattern.search(text_lower):
             target = base_date + timedelta(days=offset)
             return datetime(target.year, target.month, target.day)
     
@@ -36,13 +47,9 @@ def extract_time_from_text(text: str) -> Optional[Tuple[int, int]]:
     if not text:
         return None
     
-    time_patterns = [
-        r'(\d{1,2})[:\.](\d{2})\s*(?:uhr)?',
-        r'(\d{1,2})\s*uhr',
-    ]
-    
-    for pattern in time_patterns:
-        for time_match in re.finditer(pattern, text.lower()):
+    text_lower = text.lower()
+    for pattern in TIME_PATTERNS:
+        for time_match in pattern.finditer(text_lower):
             hour = int(time_match.group(1))
             minute = 0
             if time_match.lastindex and time_match.lastindex >= 2:
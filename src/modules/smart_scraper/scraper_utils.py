@@ -11,7 +11,20 @@ Provides common functionality like:
 import json
 import re
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
+
+
+# Map iframe coordinate patterns, in priority order (first search wins)
+IFRAME_COORDINATE_PATTERNS = (
+    # Google Maps: ?q=lat,lon or @lat,lon
+    re.compile(r'[?&@]q?=?(-?\d+\.\d+),(-?\d+\.\d+)'),
+    # OpenStreetMap: ?mlat=lat&mlon=lon
+    re.compile(r'mlat=(-?\d+\.\d+)&mlon=(-?\d+\.\d+)'),
+    # OpenStreetMap: #map=zoom/lat/lon
+    re.compile(r'#map=\d+/(-?\d+\.\d+)/(-?\d+\.\d+)'),
+    # Apple Maps: ll=lat,lon or ?ll=lat,lon
+    re.compile(r'[?&]?ll=(-?\d+\.\d+),(-?\d+\.\d+)'),
+)
 
 
 def round_coordinate(coord: float) -> float:
@@ -93,33 +106,11 @@ class CoordinateExtractor:
         if not iframe_src:
             return None
         
-        # Google Maps patterns: ?q=lat,lon or @lat,lon
-        google_match = re.search(r'[?&@]q?=?(-?\d+\.\d+),(-?\d+\.\d+)', iframe_src)
-        if google_match:
-            lat = round_coordinate(float(google_match.group(1)))
-            lon = round_coordinate(float(google_match.group(2)))
-            return lat, lon
-        
-        # OpenStreetMap pattern: ?mlat=lat&mlon=lon
-        osm_match1 = re.search(r'mlat=(-?\d+\.\d+)&mlon=(-?\d+\.\d+)', iframe_src)
-        if osm_match1:
-            lat = round_coordinate(float(osm_match1.group(1)))
-            lon = round_coordinate(float(osm_match1.group(2)))
-            return lat, lon
-        
-        # OpenStreetMap pattern: #map=zoom/lat/lon
-        osm_match2 = re.search(r'#map=\d+/(-?\d+\.\d+)/(-?\d+\.\d+)', iframe_src)
-        if osm_match2:
-            lat = round_coordinate(float(osm_match2.group(1)))
-            lon = round_coordinate(float(osm_match2.group(2)))
-            return lat, lon
-        
-        # Apple Maps pattern: ll=lat,lon or ?ll=lat,lon
-        apple_match = re.search(r'[?&]?ll=(-?\d+\.\d+),(-?\d+\.\d+)', iframe_src)
-        if apple_match:
-            lat = round_coordinate(float(apple_match.group(1)))
-            lon = round_coordinate(float(apple_match.group(2)))
-            return lat, lon
+        for pattern in IFRAME_COORDINATE_PATTERNS:
+            match = pattern.search(iframe_src)
+            if match:
+                lat, lon = match.group(1, 2)
+                return round_coordinate(float(lat)), round_coordinate(float(lon))
         
         return None
 
@@ -143,6 +134,8 @@ class LocationNormalizer:
         """
         self.base_path = base_path
         self.verified_locations = {}
+        # Lowercased name -> verified data, for case-insensitive lookups
+        self._verified_by_lower_name = {}
         self.location_tracker = None
         self.geolocation_resolver = None
         
@@ -162,6 +155,10 @@ class LocationNormalizer:
                     self.verified_locations = data.get('locations', {})
         except Exception as e:
             print(f"  ⚠ Warning: Could not load verified locations: {e}")
+        
+        # The first name in file order wins when names differ only by case
+        for name, data in self.verified_locations.items():
+            self._verified_by_lower_name.setdefault(name.lower(), data)
     
     def _init_location_tracker(self, base_path: Path):
         """Initialize location tracker for unverified locations."""
@@ -198,11 +195,51 @@ class LocationNormalizer:
             return verified
         
         # Step 2: Check verified locations (case-insensitive match)
-        location_name_lower = location_name.lower()
-        for verified_name, verified_data in self.verified_locations.items():
-            if verified_name.lower() == location_name_lower:
-                return verified_data.copy()
+        verified_data = self._verified_by_lower_name.get(location_name.lower())
+        if verified_data is not None:
+            return verified_data.copy()
+        
+        return self._normalize_unverified(location, source_name)
+    
+    def normalize_batch(self, locations: List[Dict[str, Any]],
+                        source_name: str = 'unknown') -> List[Dict[str, Any]]:
+        """
+        Normalize a list of locations (same results as normalize() on each).
         
+        Verified locations are resolved in one pass of dict lookups; only
+        the remaining ones are disambiguated and tracked, in list order.
+        
+        Args:
+            locations: Location dicts with name, lat, lon
+            source_name: Name of the scraper source
+            
+        Returns:
+            Normalized location dicts, in input order
+        """
+        verified_locations = self.verified_locations
+        verified_by_lower_name = self._verified_by_lower_name
+        normalized = []
+        unverified = []
+        for location in locations:
+            if not location or not location.get('name'):
+                normalized.append(location)
+                continue
+            location_name = location['name'].strip()
+            verified = verified_locations.get(location_name)
+            if verified is None:
+                verified = verified_by_lower_name.get(location_name.lower())
+            if verified is None:
+                unverified.append(len(normalized))
+                normalized.append(location)
+            else:
+                normalized.append(verified.copy())
+        
+        for index in unverified:
+            normalized[index] = self._normalize_unverified(normalized[index], source_name)
+        return normalized
+    
+    def _normalize_unverified(self, location: Dict[str, Any], source_name: str) -> Dict[str, Any]:
+        """Disambiguate a location missing from the verified database and track it."""
         # Step 3: Disambiguate ambiguous locations (append city name)
         location = AmbiguousLocationHandler.disambiguate(location)
         
@@ -267,7 +304,7 @@ class AddressExtractor:
     """Extract addresses from German text patterns."""
     
     # German address pattern: Street Number, ZIP City
-    GERMAN_ADDRESS_PATTERN = r'([A-ZÄÖÜ][a-zäöüß\-\s\.]+\s+\d+[a-z]?\s*,\s*\d{5}\s+[A-ZÄÖÜ][a-zäöüß\-\s]+)'
+    GERMAN_ADDRESS_PATTERN = re.compile(r'([A-ZÄÖÜ][a-zäöüß\-\s\.]+\s+\d+[a-z]?\s*,\s*\d{5}\s+[A-ZÄÖÜ][a-zäöüß\-\s]+)')
     
     @staticmethod
     def extract_german_address(text: str) -> Optional[str]:
@@ -286,8 +323,9 @@ class AddressExtractor:
         if not text:
             return None
         
-        matches = re.findall(AddressExtractor.GERMAN_ADDRESS_PATTERN, text)
-        return matches[0].strip() if matches else None
+        # Only the first address is used: stop at the first match
+        match = AddressExtractor.GERMAN_ADDRESS_PATTERN.search(text)
+        return match.group(1).strip() if match else None
 
 
 class VenueDetector:
@@ -301,6 +339,8 @@ class VenueDetector:
         'Saal', 'Kulturzentrum', 'Bibliothek', 'Stadthalle',
         'Konzerthaus', 'Oper', 'Festspielhaus', 'Dom'
     ]
+    # Any venue type as a substring of lowercased text, in one scan
+    VENUE_TYPE_PATTERN = re.compile('|'.join(re.escape(venue_type.lower()) for venue_type in VENUE_TYPES))
     
     @staticmethod
     def contains_venue_indicator(text: str) -> bool:
@@ -320,8 +360,7 @@ class VenueDetector:
         if not text:
             return False
         
-        text_lower = text.lower()
-        return any(venue_type.lower() in text_lower for venue_type in VenueDetector.VENUE_TYPES)
+        return VenueDetector.VENUE_TYPE_PATTERN.search(text.lower()) is not None
     
     @staticmethod
     def extract_venue_from_headings(headings: list) -> Optional[str]:
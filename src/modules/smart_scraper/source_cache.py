@@ -1,18 +1,24 @@
 """Simple cache for tracking processed source items."""
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Optional
 import json
+import os
 
 
 @dataclass
 class SourceCache:
-    """Persistent cache of processed item keys for a source."""
+    """Persistent cache of processed item keys for a source.
+    
+    Keys are kept least recently seen first; when the cache is full, the
+    least recently seen key is dropped.
+    """
     cache_path: Optional[Path]
     max_entries: int = 500
-    processed_keys: Set[str] = field(default_factory=set)
+    processed_keys: "OrderedDict[str, None]" = field(default_factory=OrderedDict)
 
     def load(self) -> None:
         """Load cache from disk."""
@@ -24,20 +30,21 @@ class SourceCache:
         except (json.JSONDecodeError, OSError):
             return
         
-        self.processed_keys = set(data.get("processed_keys", []))
+        self.processed_keys = OrderedDict.fromkeys(data.get("processed_keys", []))
     
     def is_processed(self, key: str) -> bool:
         """Check if key was already processed."""
-        return key in self.processed_keys
+        if key in self.processed_keys:
+            self.processed_keys.move_to_end(key)
+            return True
+        return False
     
     def mark_processed(self, key: str) -> None:
         """Record a processed key."""
-        if key in self.processed_keys:
-            return
-        self.processed_keys.add(key)
-        if len(self.processed_keys) > self.max_entries:
-            trimmed = sorted(self.processed_keys)
-            self.processed_keys = set(trimmed[-self.max_entries:])
+        self.processed_keys[key] = None
+        self.processed_keys.move_to_end(key)
+        while len(self.processed_keys) > self.max_entries:
+            self.processed_keys.popitem(last=False)
     
     def save(self) -> None:
         """Persist cache to disk."""
@@ -46,7 +53,12 @@ class SourceCache:
         
         self.cache_path.parent.mkdir(parents=True, exist_ok=True)
         payload = {
-            "processed_keys": sorted(self.processed_keys),
+            "processed_keys": list(self.processed_keys),
             "updated_at": datetime.now().isoformat()
         }
-        self.cache_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        # Streamed straight to disk (the cache is only read by this class),
+        # then swapped in so a crash never leaves a truncated cache
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        with tmp_path.open("w", encoding="utf-8", buffering=65536) as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp_path, self.cache_path)
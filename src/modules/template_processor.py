@@ -19,11 +19,61 @@ Usage:
 
 import re
 import logging
+import functools
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Template syntax patterns (compiled once at import)
+# {{VARIABLE}}
+PLACEHOLDER_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+# {{IF variable}}...{{ENDIF}}
+CONDITIONAL_BLOCK_PATTERN = re.compile(r'\{\{IF\s+(\w+)\}\}(.*?)\{\{ENDIF\}\}', re.DOTALL)
+# {{IF variable}}
+CONDITIONAL_PATTERN = re.compile(r'\{\{IF\s+(\w+)\}\}')
+# {{ with no closing brace before the end of the template
+UNCLOSED_PLACEHOLDER_PATTERN = re.compile(r'\{\{[^\}]*$')
+PLACEHOLDER_NAME_PATTERN = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
+
+def _replace_conditional(context: Dict[str, Any], match) -> str:
+    """Keep or drop one {{IF}} block depending on its context variable"""
+    var_name = match.group(1)
+    content = match.group(2)
+    
+    # Check if variable is truthy
+    value = context.get(var_name, False)
+    
+    # Support string checks
+    if isinstance(value, str):
+        # Check for specific values
+        if '=' in var_name:
+            # Format: {{IF mode=svg-paths}}
+            parts = var_name.split('=')
+            var_name = parts[0].strip()
+            expected = parts[1].strip()
+            value = context.get(var_name)
+            return content if str(value) == expected else ''
+        else:
+            return content if value and value.lower() not in ['false', '0', 'no', 'none'] else ''
+    
+    return content if value else ''
+
+
+def _replace_placeholder(context: Dict[str, Any], match) -> str:
+    """Render one {{VARIABLE}} from its context value"""
+    var_name = match.group(1)
+    value = context.get(var_name, '')
+    
+    # Convert to string
+    if value is None:
+        return ''
+    elif isinstance(value, bool):
+        return str(value).lower()
+    else:
+        return str(value)
+
 
 class TemplateProcessor:
     """
@@ -81,30 +131,7 @@ class TemplateProcessor:
         Returns:
             Template with conditionals processed
         """
-        # Pattern: {{IF variable}}...{{ENDIF}}
-        pattern = r'\{\{IF\s+(\w+)\}\}(.*?)\{\{ENDIF\}\}'
-        
-        def replace_conditional(match):
-            var_name = match.group(1)
-            content = match.group(2)
-            
-            # Check if variable is truthy
-            value = context.get(var_name, False)
-            
-            # Support string checks
-            if isinstance(value, str):
-                # Check for specific values
-                if '=' in var_name:
-                    # Format: {{IF mode=svg-paths}}
-                    parts = var_name.split('=')
-                    var_name = parts[0].strip()
-                    expected = parts[1].strip()
-                    value = context.get(var_name)
-                    return content if str(value) == expected else ''
-                else:
-                    return content if value and value.lower() not in ['false', '0', 'no', 'none'] else ''
-            
-            return content if value else ''
+        replace_conditional = functools.partial(_replace_conditional, context)
         
         # Process recursively (for nested conditionals)
         max_iterations = 10
@@ -112,7 +139,7 @@ class TemplateProcessor:
         
         while '{{IF' in template and iteration < max_iterations:
             prev = template
-            template = re.sub(pattern, replace_conditional, template, flags=re.DOTALL)
+            template = CONDITIONAL_BLOCK_PATTERN.sub(replace_conditional, template)
             
             if template == prev:
                 break
@@ -137,22 +164,7 @@ class TemplateProcessor:
         Returns:
             Template with placeholders replaced
         """
-        # Pattern: {{VARIABLE}}
-        pattern = r'\{\{(\w+)\}\}'
-        
-        def replace_placeholder(match):
-            var_name = match.group(1)
-            value = context.get(var_name, '')
-            
-            # Convert to string
-            if value is None:
-                return ''
-            elif isinstance(value, bool):
-                return str(value).lower()
-            else:
-                return str(value)
-        
-        return re.sub(pattern, replace_placeholder, template)
+        return PLACEHOLDER_PATTERN.sub(functools.partial(_replace_placeholder, context), template)
     
     def extract_placeholders(self, template: str) -> List[str]:
         """
@@ -165,12 +177,10 @@ class TemplateProcessor:
             List of placeholder names
         """
         # Find all {{VARIABLE}} patterns
-        simple_pattern = r'\{\{(\w+)\}\}'
-        simple = re.findall(simple_pattern, template)
+        simple = PLACEHOLDER_PATTERN.findall(template)
         
         # Find all {{IF condition}} patterns
-        conditional_pattern = r'\{\{IF\s+(\w+)\}\}'
-        conditional = re.findall(conditional_pattern, template)
+        conditional = CONDITIONAL_PATTERN.findall(template)
         
         # Combine and deduplicate
         all_placeholders = list(set(simple + conditional))
@@ -202,14 +212,14 @@ class TemplateProcessor:
             errors.append(f"Unbalanced IF/ENDIF: {if_count} IF vs {endif_count} ENDIF")
         
         # Check for malformed placeholders
-        malformed = re.findall(r'\{\{[^\}]*$', template)
+        malformed = UNCLOSED_PLACEHOLDER_PATTERN.findall(template)
         if malformed:
             errors.append(f"Unclosed placeholders found: {len(malformed)}")
         
         # Check for invalid placeholder names
         placeholders = self.extract_placeholders(template)
         for placeholder in placeholders:
-            if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_]*$', placeholder):
+            if not PLACEHOLDER_NAME_PATTERN.match(placeholder):
                 errors.append(f"Invalid placeholder name: {placeholder}")
         
         return len(errors) == 0, errors
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Tests for the custom source handler manager."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.custom_source_manager import CustomSourceManager
+
+
+class TestNameConversion(unittest.TestCase):
+    """Test source name conversion helpers."""
+
+    def test_snake_case_from_pascal(self):
+        """Test PascalCase names are split on case boundaries."""
+        self.assertEqual(CustomSourceManager._to_snake_case('MyNewsSource'), 'my_news_source')
+
+    def test_snake_case_special_chars(self):
+        """Test spaces and punctuation become underscores."""
+        self.assertEqual(CustomSourceManager._to_snake_case('my source-x'), 'my_source_x')
+
+    def test_pascal_case(self):
+        """Test spaces, underscores and hyphens are joined as PascalCase."""
+        self.assertEqual(CustomSourceManager._to_pascal_case('my source-x'), 'MySourceX')
+        self.assertEqual(CustomSourceManager._to_pascal_case('kulturzentrum_hof'), 'KulturzentrumHof')
+
+    def test_conversion_is_memoized(self):
+        """Test repeated conversions are served from the cache."""
+        CustomSourceManager._to_snake_case('CachedName')
+        hits_before = CustomSourceManager._to_snake_case.cache_info().hits
+        CustomSourceManager._to_snake_case('CachedName')
+        self.assertEqual(CustomSourceManager._to_snake_case.cache_info().hits, hits_before + 1)
+
+
+class TestSourceCodeGeneration(unittest.TestCase):
+    """Test generated source handler code."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.manager = CustomSourceManager(Path(self.tmpdir.name))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_templates_compile(self):
+        """Test every location strategy produces valid Python."""
+        for strategy in ('detail_page', 'listing_page', 'api_field', 'geocode'):
+            code = self.manager._generate_source_code(
+                'My Events', 'https://example.com', 'html', strategy
+            )
+            compile(code, f'{strategy}.py', 'exec')
+            self.assertIn('class MyEventsSource(BaseSource):', code)
+            self.assertIn('"type": "my_events"', code)
+            self.assertIn('"url": "https://example.com"', code)
+
+
+class TestSourceModuleCache(unittest.TestCase):
+    """Test loaded source modules are reused until the file changes."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.manager = CustomSourceManager(Path(self.tmpdir.name))
+        self.source_file = self.manager.custom_sources_dir / 'cached_source.py'
+        self.source_file.write_text('VALUE = 1\n')
+
+    def tearDown(self):
+        CustomSourceManager._module_cache.pop(self.source_file, None)
+        self.tmpdir.cleanup()
+
+    def test_unchanged_file_reuses_module(self):
+        """Test a second load returns the same module object."""
+        first = self.manager._load_source_module('cached_source', self.source_file)
+        second = self.manager._load_source_module('cached_source', self.source_file)
+        self.assertIs(first, second)
+
+    def test_modified_file_is_reloaded(self):
+        """Test a newer file is executed again."""
+        first = self.manager._load_source_module('cached_source', self.source_file)
+        self.source_file.write_text('VALUE = 2\n')
+        mtime = self.source_file.stat().st_mtime
+        os.utime(self.source_file, (mtime + 1, mtime + 1))
+        second = self.manager._load_source_module('cached_source', self.source_file)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.VALUE, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
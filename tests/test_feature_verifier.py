@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Tests for the feature verifier's pattern checks."""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.feature_verifier import FeatureVerifier, required_literals
+
+
+class TestRequiredLiterals(unittest.TestCase):
+    """Test the literals used to prescreen code patterns."""
+
+    def test_plain_and_regex(self):
+        """Test the longest literal run of a pattern is required."""
+        self.assertEqual(required_literals('class DocsRunner'), (b'class DocsRunner',))
+        self.assertEqual(required_literals(r'def\s+run_task\('), (b'run_task(',))
+        self.assertEqual(required_literals('colou?r'), (b'colo',))
+
+    def test_alternatives(self):
+        """Test one literal per top-level alternative, none if one has none."""
+        self.assertEqual(required_literals('getNextSunrise|sunrise'), (b'getNextSunrise', b'sunrise'))
+        self.assertEqual(required_literals(r'sunrise|\d+'), ())
+
+    def test_no_prescreen(self):
+        """Test case-insensitive and invalid patterns get no literals."""
+        self.assertEqual(required_literals('(?i)docs'), ())
+        self.assertEqual(required_literals('(?i:docs)'), ())
+        self.assertEqual(required_literals('docs('), ())
+
+    def test_bytes(self):
+        """Test literals match how the pattern is compiled on UTF-8 bytes."""
+        self.assertEqual(required_literals('Hof Straße'), ('Hof Straße'.encode('utf-8'),))
+        self.assertEqual(required_literals(r'\xe9t\xe9'), (b'\xe9t\xe9',))
+
+
+class TestCodePatterns(unittest.TestCase):
+    """Test code pattern checks against a temporary repository."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.repo_root = Path(self.tmpdir.name)
+        (self.repo_root / 'app.js').write_text('function calculateDistance() {}\n')
+        self.verifier = FeatureVerifier(self.repo_root)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def check(self, *patterns):
+        feature = {'code_patterns': [{'file': 'app.js', 'pattern': p} for p in patterns]}
+        return self.verifier.check_code_patterns(feature)
+
+    def test_found_and_missing(self):
+        """Test found patterns pass and absent ones are reported."""
+        passed, missing = self.check('calculateDistance', 'getNextSunrise|sunrise')
+        self.assertFalse(passed)
+        self.assertEqual([m['pattern'] for m in missing], ['getNextSunrise|sunrise'])
+        self.assertEqual(missing[0]['reason'], 'pattern not found')
+
+    def test_overlapping_patterns(self):
+        """Test a pattern overlapping another one in the same file is found."""
+        passed, missing = self.check('calc', 'calculateDistance', r'function\s+calc')
+        self.assertTrue(passed)
+        self.assertEqual(missing, [])
+
+    def test_prescreen(self):
+        """Test the literal prescreen doesn't hide matches or report false ones."""
+        passed, missing = self.check(r'function\s+calc', 'calc(?:ulate)?Distance', '(?i)FUNCTION', r'getNext|Distance\(')
+        self.assertTrue(passed)
+        passed, missing = self.check('calculateDistance', r'function\s+getNextSunrise')
+        self.assertEqual([m['pattern'] for m in missing], [r'function\s+getNextSunrise'])
+        self.assertEqual(missing[0]['reason'], 'pattern not found')
+
+    def test_plain_text_patterns(self):
+        """Test plain-text patterns are searched as text, regexes as regexes."""
+        self.assertEqual(self.verifier._get_pattern('calculateDistance'), ('literal', b'calculateDistance'))
+        self.assertEqual(self.verifier._get_pattern('calc.*')[0], 'regex')
+        passed, missing = self.check('calculateDistance', 'function calc', 'calculate Distance', 'getNextSunrise')
+        self.assertEqual([m['pattern'] for m in missing], ['calculate Distance', 'getNextSunrise'])
+
+    def test_large_file(self):
+        """Test patterns are found in files scanned through mmap."""
+        (self.repo_root / 'app.js').write_text('// padding\n' * 10000 + 'function calculateDistance() {}\n')
+        passed, missing = self.check('calculateDistance', r'function\s+calc', 'getNextSunrise')
+        self.assertFalse(passed)
+        self.assertEqual([m['pattern'] for m in missing], ['getNextSunrise'])
+        self.verifier._clear_file_cache()
+
+    def test_missing_file(self):
+        """Test patterns in a missing file report the file."""
+        feature = {'code_patterns': [{'file': 'nope.js', 'pattern': 'x'}]}
+        passed, missing = self.verifier.check_code_patterns(feature)
+        self.assertFalse(passed)
+        self.assertEqual(missing[0]['reason'], 'file not found')
+
+
+class TestConfigKeys(unittest.TestCase):
+    """Test nested config key lookups."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.repo_root = Path(self.tmpdir.name)
+        config = {'map': {'center': {'lat': 50.3}, 'layers': [{'name': 'osm'}]}, 'a.b': 1}
+        (self.repo_root / 'config.json').write_text(json.dumps(config))
+        self.verifier = FeatureVerifier(self.repo_root)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_nested_keys(self):
+        """Test every level of a nested key is found."""
+        for key in ('map', 'map.center', 'map.center.lat', 'map.layers'):
+            self.assertTrue(self.verifier._check_config_key_in_file('config.json', key), key)
+
+    def test_missing_keys(self):
+        """Test keys below lists or scalars and dotted key names are not found."""
+        for key in ('map.center.lat.x', 'map.layers.name', 'a.b', 'zoom'):
+            self.assertFalse(self.verifier._check_config_key_in_file('config.json', key), key)
+
+    def test_missing_file(self):
+        """Test a missing config file has no keys."""
+        self.assertFalse(self.verifier._check_config_key_in_file('nope.json', 'map'))
+
+
+class TestVerifyAll(unittest.TestCase):
+    """Test verification of a whole feature registry."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.repo_root = Path(self.tmpdir.name)
+        (self.repo_root / 'app.js').write_text('function calculateDistance() {}\n')
+        features = [
+            {'id': f'feature-{i}', 'name': f'Feature {i}', 'files': ['app.js'],
+             'code_patterns': [{'file': 'app.js', 'pattern': 'calculateDistance' if i % 2 else 'missing'}]}
+            for i in range(6)
+        ]
+        features.insert(3, {'id': 'planned', 'name': 'Planned', 'implemented': False})
+        (self.repo_root / 'features.json').write_text(json.dumps({'features': features}))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_results_keep_registry_order(self):
+        """Test results and counts when features are verified concurrently."""
+        results = FeatureVerifier(self.repo_root).verify_all()
+        self.assertEqual(
+            [f['id'] for f in results['features']],
+            ['feature-0', 'feature-1', 'feature-2', 'planned', 'feature-3', 'feature-4', 'feature-5']
+        )
+        self.assertEqual(results['features'][3]['status'], 'skipped')
+        self.assertEqual(results['features'][4]['status'], 'passed')
+        self.assertEqual((results['passed'], results['failed'], results['skipped']), (3, 3, 1))
+
+    def test_fail_fast(self):
+        """Test fail-fast stops at the first failing feature."""
+        results = FeatureVerifier(self.repo_root, fail_fast=True).verify_all()
+        self.assertEqual([f['id'] for f in results['features']], ['feature-0'])
+        self.assertEqual((results['passed'], results['failed']), (0, 1))
+
+    def test_fail_fast_skips_checks_after_missing_files(self):
+        """Test fail-fast skips pattern checks when files are missing."""
+        feature = {'id': 'gone', 'name': 'Gone', 'files': ['gone.js'],
+                   'code_patterns': [{'file': 'gone.js', 'pattern': 'x'}]}
+        result = FeatureVerifier(self.repo_root, fail_fast=True).verify_feature(feature)
+        self.assertEqual(result['status'], 'failed')
+        self.assertEqual([c['type'] for c in result['checks']], ['files'])
+
+    def test_caches_released(self):
+        """Test file contents are released after verify_all and verify_feature."""
+        verifier = FeatureVerifier(self.repo_root)
+        verifier.verify_all()
+        self.assertEqual(verifier._file_cache, {})
+        feature = {'id': 'one', 'name': 'One',
+                   'code_patterns': [{'file': 'app.js', 'pattern': 'calculateDistance'}]}
+        self.assertEqual(verifier.verify_feature(feature)['status'], 'passed')
+        self.assertEqual(verifier._file_cache, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,12 +13,14 @@ Validates that the linter correctly identifies issues in:
 
 import sys
 import json
+import tempfile
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.modules.linter import Linter, LintResult
+from src.modules.lint_cache import LintCache
 
 
 def test_javascript_linting():
@@ -51,6 +53,12 @@ def test_javascript_linting():
     assert any('eval' in error.lower() for error in result.errors)
     print("✓ JavaScript with eval() correctly flagged")
     
+    # Identifiers merely ending in eval/alert are not flagged
+    result = linter.lint_javascript("const éeval = f; éeval(code); İalert ('test');", "unicode.js")
+    assert not any('eval' in message.lower() or 'alert' in message.lower()
+                   for message in result.errors + result.warnings), result.errors + result.warnings
+    print("✓ Non-ASCII identifiers ending in eval/alert not flagged")
+    
     # Test mismatched brackets
     bad_brackets_js = """
     function test() {
@@ -160,6 +168,25 @@ def test_html_linting():
     print("\n✅ HTML linting tests passed")
 
 
+def test_html_validator_reuse():
+    """Test the shared HTML validator starts each document fresh"""
+    linter = Linter()
+
+    # First document ends inside <script>; the next one must still be parsed
+    linter.html_validator.validate("<div><script>var x = 1;")
+    result = linter.html_validator.validate("<p></div>")
+    assert any('Mismatched tag' in error for error in result.errors)
+    print("✓ Validator state reset between documents")
+
+    # Attributes without a value don't abort parsing
+    result = linter.html_validator.validate(
+        '<a href>x</a><a href="https://example.com" rel>y</a><img src="a.png" alt>'
+    )
+    assert result.errors == [], result.errors
+    assert len(result.warnings) == 1 and 'noopener' in result.warnings[0]
+    print("✓ Valueless attributes handled")
+
+
 def test_svg_linting():
     """Test SVG linting"""
     print("\n" + "=" * 60)
@@ -222,6 +249,16 @@ def test_translation_linting():
     assert result.passed, "Valid translations should pass"
     print("✓ Valid translations passed")
     
+    # Test only empty strings in dicts are reported, in document order
+    nested_trans = dict(valid_trans, map={"a": {"b": ""}, "list": [None, "", {"c": " "}], "d": ""})
+    result = linter.lint_translations(nested_trans, "en")
+    assert result.warnings == [
+        "Translation 'en' has empty value at: map.a.b",
+        "Translation 'en' has empty value at: map.list[2].c",
+        "Translation 'en' has empty value at: map.d",
+    ], result.warnings
+    print("✓ Empty translation values reported in order")
+
     # Test empty translations
     result = linter.lint_translations({}, "en")
     assert not result.passed, "Empty translations should fail"
@@ -299,7 +336,29 @@ def test_accessibility_linting():
     result = linter.lint_accessibility(no_alt_html)
     assert not result.passed, "Image without alt should fail"
     print("✓ Missing alt text correctly flagged")
-    
+
+    # Test links whose content is only tags or whitespace
+    links_html = """
+    <html lang="en">
+    <body>
+        <a href="/a"> <i class="icon"></i> </a>
+        <a href="/b"><span>Text</span></a>
+        <a href="/c">&lt;<></a>
+    </body>
+    </html>
+    """
+    result = linter.lint_accessibility(links_html)
+    link_errors = [e for e in result.errors if 'Link without text' in e]
+    assert len(link_errors) == 1, f"Expected one empty link, got {link_errors}"
+    print("✓ Links without text correctly flagged")
+
+    # Test repeated offenders are capped per rule
+    many_imgs_html = '<html lang="en"><body>' + '<img src="a.png">' * 60 + '</body></html>'
+    result = linter.lint_accessibility(many_imgs_html)
+    assert len([e for e in result.errors if "missing 'alt'" in e]) == 50
+    assert "(+10 more images missing 'alt' attribute, suppressed)" in result.warnings
+    print("✓ Repeated errors capped per rule")
+
     print("\n✅ Accessibility linting tests passed")
 
 
@@ -366,6 +425,58 @@ def test_complete_lint():
     print("\n✅ Complete lint workflow test passed")
 
 
+def test_lint_file_cache():
+    """Test per-file results are reused for unchanged content"""
+    print("\n" + "=" * 60)
+    print("Testing Lint File Cache")
+    print("=" * 60)
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_file = Path(tmpdir) / 'lint_cache.json'
+        html_content = "<!DOCTYPE html><html lang=\"en\"><head><title>T</title></head><body></body></html>"
+        scripts = {"app.js": "console.log('x'); eval(code);"}
+        
+        first = Linter(cache_file=cache_file).lint_all(html_content, {}, scripts)
+        assert cache_file.exists(), "Cache file should be written"
+        
+        # A new linter must reuse the stored result instead of linting again
+        linter = Linter(cache_file=cache_file)
+        linter.lint_javascript = lambda *args: (_ for _ in ()).throw(AssertionError("not cached"))
+        second = linter.lint_all(html_content, {}, scripts)
+        assert second.errors == first.errors and second.warnings == first.warnings
+        print("✓ Unchanged file result reused")
+        
+        # Changed content is linted again
+        linter = Linter(cache_file=cache_file)
+        result = linter.lint_all(html_content, {}, {"app.js": "const x = 1;"})
+        assert not any('eval' in error for error in result.errors)
+        print("✓ Changed file linted again")
+        
+        # Files not linted in a run are dropped from the cache
+        Linter(cache_file=cache_file).lint_all(html_content, {}, {"other.js": "const y = 2;"})
+        entries = json.loads(cache_file.read_text())['entries']
+        assert list(entries) == ['javascript:other.js'], entries
+        print("✓ Entries of files no longer linted dropped")
+        
+        # Results cached under other lint rules are discarded
+        data = json.loads(cache_file.read_text())
+        data['version'] = 'rules-of-an-older-linter'
+        cache_file.write_text(json.dumps(data))
+        assert Linter(cache_file=cache_file).file_cache.entries == {}
+        print("✓ Cache rebuilt when the lint rules change")
+        
+        # Every source the results depend on is part of the version
+        rules, result_format = Path(tmpdir) / 'rules.py', Path(tmpdir) / 'result.py'
+        rules.write_text('rules')
+        result_format.write_text('format 1')
+        version = LintCache(cache_file, [rules, result_format]).version
+        result_format.write_text('format 2')
+        assert LintCache(cache_file, [rules, result_format]).version != version
+        print("✓ Cache rebuilt when the result format changes")
+    
+    print("\n✅ Lint file cache tests passed")
+
+
 def main():
     """Run all linter tests"""
     print("\n" + "=" * 60)
@@ -380,6 +491,7 @@ def main():
         test_translation_linting()
         test_accessibility_linting()
         test_complete_lint()
+        test_lint_file_cache()
         
         print("\n" + "=" * 60)
         print("✅ ALL LINTER TESTS PASSED")
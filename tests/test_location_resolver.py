@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Tests for venue extraction from event detail pages."""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from bs4 import BeautifulSoup
+
+from modules.location_resolver import LocationResolver
+
+
+class TestExtractLocation(unittest.TestCase):
+    """Test the extraction strategies on parsed pages."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.resolver = LocationResolver(Path(self.tmpdir.name), {})
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def extract(self, html):
+        return self.resolver._extract_location_frankenpost(BeautifulSoup(html, 'lxml'))
+
+    def test_schema_org(self):
+        """Test schema.org microdata takes precedence over labels."""
+        html = ('<p>Ort: Hof</p><div itemtype="https://schema.org/Event">'
+                '<div itemprop="location"><span itemprop="name"> Theater Hof </span>'
+                '<span itemprop="address">Kulmbacher Straße 5</span></div></div>')
+        self.assertEqual(self.extract(html), {'name': 'Theater Hof', 'address': 'Kulmbacher Straße 5'})
+
+    def test_label(self):
+        """Test explicit labels are cut at commas and pipes."""
+        html = '<p>Veranstaltungsort: Freiheitshalle, Saal 2</p><p>95028 Hof</p>'
+        self.assertEqual(self.extract(html), {'name': 'Freiheitshalle', 'address': '95028 Hof'})
+
+    def test_venue_class(self):
+        """Test elements with a venue class skip generic names."""
+        html = '<span class="event-location">Hof</span><span class="venue">Galeriehaus</span>'
+        self.assertEqual(self.extract(html)['name'], 'Galeriehaus')
+
+    def test_table_row(self):
+        """Test table rows labelled with a location keyword."""
+        html = '<table><tr><th>Wo</th><td>Kunstverein</td></tr></table>'
+        self.assertEqual(self.extract(html)['name'], 'Kunstverein')
+
+    def test_no_location(self):
+        """Test pages without a venue give no location."""
+        self.assertIsNone(self.extract('<p>Konzert am Abend</p>'))
+
+
+class FakeResponse:
+    """Streamed response serving a fixed body."""
+
+    def __init__(self, body, content_type, encoding=None):
+        self.body = body
+        self.headers = {'Content-Type': content_type}
+        self.status_code = 200
+        self.encoding = encoding
+        self.url = 'https://example.org/event'
+        self.read = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            self.read += chunk_size
+            yield self.body[start:start + chunk_size]
+
+
+class FakeSession:
+    """Session returning one prepared response."""
+
+    def __init__(self, response):
+        self.response = response
+        self.headers = None
+
+    def get(self, url, **kwargs):
+        self.headers = kwargs.get('headers')
+        return self.response
+
+
+class TestFetchPage(unittest.TestCase):
+    """Test which detail pages are downloaded and parsed."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.resolver = LocationResolver(Path(self.tmpdir.name), {})
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def fetch(self, response):
+        self.resolver.session = FakeSession(response)
+        return self.resolver._extract_location_from_url(response.url)
+
+    def test_html_page(self):
+        """Test HTML pages are read and parsed."""
+        response = FakeResponse(b'<p>Ort: Kunstverein</p>', 'text/html; charset=utf-8')
+        self.assertEqual(self.fetch(response)['name'], 'Kunstverein')
+
+    def test_declared_charset(self):
+        """Test the server charset is used to decode the page."""
+        response = FakeResponse('<p>Ort: Bürgerhaus</p>'.encode('latin-1'),
+                                'text/html; charset=ISO-8859-1', 'ISO-8859-1')
+        self.assertEqual(self.fetch(response)['name'], 'Bürgerhaus')
+
+    def test_non_html_skipped(self):
+        """Test other content types are not downloaded."""
+        response = FakeResponse(b'%PDF Ort: Kunstverein', 'application/pdf')
+        self.assertIsNone(self.fetch(response))
+        self.assertEqual(response.read, 0)
+
+    def test_large_page_truncated(self):
+        """Test only the start of a very large page is read."""
+        body = b'<p>Ort: Kunstverein</p>\n' + b'<p>x</p>\n' * 500000
+        response = FakeResponse(body, 'text/html')
+        self.assertEqual(self.fetch(response)['name'], 'Kunstverein')
+        self.assertLess(response.read, len(body))
+
+
+class TestPageCache(unittest.TestCase):
+    """Test revalidation and pruning of cached detail pages."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.resolver = LocationResolver(Path(self.tmpdir.name), {})
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def fetch(self, response):
+        self.resolver.session = FakeSession(response)
+        return self.resolver._extract_location_from_url(response.url)
+
+    def test_not_modified(self):
+        """Test a 304 reuses the cached location without reading the page."""
+        response = FakeResponse(b'<p>Ort: Kunstverein</p>', 'text/html')
+        response.headers['ETag'] = '"v1"'
+        self.assertEqual(self.fetch(response)['name'], 'Kunstverein')
+        
+        response = FakeResponse(b'', 'text/html')
+        response.status_code = 304
+        self.assertEqual(self.fetch(response)['name'], 'Kunstverein')
+        self.assertEqual(self.resolver.session.headers, {'If-None-Match': '"v1"'})
+        self.assertEqual(response.read, 0)
+
+    def test_stale_entries_pruned(self):
+        """Test pages of events no longer pending are dropped on save."""
+        location = {'name': 'Kunstverein'}
+        self.resolver.page_cache = {
+            'https://example.org/a': {'etag': '"a"', 'last_modified': None, 'location': location},
+            'https://example.org/b': {'etag': '"b"', 'last_modified': None, 'location': location},
+        }
+        self.resolver._save_page_cache({'pending_events': [{'url': 'https://example.org/a'}]})
+        
+        with open(self.resolver.page_cache_file, encoding='utf-8') as f:
+            entries = json.load(f)['entries']
+        self.assertEqual(list(entries), ['https://example.org/a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
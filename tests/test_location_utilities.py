@@ -15,12 +15,48 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from modules.smart_scraper.scraper_utils import (
     CityDetector,
+    CoordinateExtractor,
     AmbiguousLocationHandler,
     GeolocationResolver,
     LocationNormalizer
 )
 
 
+def test_coordinate_extractor_from_iframe():
+    """Test coordinate extraction from map iframe URLs."""
+    print("\n" + "="*60)
+    print("Test: CoordinateExtractor.extract_from_iframe()")
+    print("="*60)
+    
+    test_cases = [
+        ("https://maps.google.com/maps?q=50.316712,11.916734&z=15", (50.3167, 11.9167)),
+        ("https://www.google.com/maps/@49.9440,11.5760,15z", (49.944, 11.576)),
+        ("https://www.openstreetmap.org/?mlat=50.1705&mlon=12.1328", (50.1705, 12.1328)),
+        ("https://www.openstreetmap.org/#map=15/50.2489/12.0364", (50.2489, 12.0364)),
+        ("https://maps.apple.com/?ll=50.1050,11.4458", (50.105, 11.4458)),
+        # Google coordinates win even when another provider's come first
+        ("https://example.com/?ll=1.0,2.0&q=50.3167,11.9167", (50.3167, 11.9167)),
+        ("https://example.com/no-coordinates", None),
+        ("", None),
+    ]
+    
+    passed = 0
+    failed = 0
+    
+    for url, expected in test_cases:
+        result = CoordinateExtractor.extract_from_iframe(url)
+        if result == expected:
+            print(f"  ✓ '{url[:50]}' → {result}")
+            passed += 1
+        else:
+            print(f"  ✗ '{url[:50]}' → Expected {expected}, got {result}")
+            failed += 1
+    
+    print(f"\nResults: {passed} passed, {failed} failed")
+    assert failed == 0
+    return failed == 0
+
+
 def test_city_detector_from_text():
     """Test city extraction from venue names and text."""
     print("\n" + "="*60)
@@ -326,6 +362,39 @@ def test_geolocation_resolver():
         return failed == 0
 
 
+def test_location_normalizer_batch():
+    """Test batch normalization matches normalizing each location."""
+    print("\n" + "="*60)
+    print("Test: LocationNormalizer.normalize_batch()")
+    print("="*60)
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        base_path = Path(tmpdir)
+        assets_json = base_path / 'assets' / 'json'
+        assets_json.mkdir(parents=True)
+        
+        verified = {"Theater Hof": {"name": "Theater Hof", "lat": 50.3200, "lon": 11.9180}}
+        with open(assets_json / 'verified_locations.json', 'w') as f:
+            json.dump({"locations": verified}, f)
+        
+        locations = [
+            {"name": "Theater Hof"},
+            {"name": " theater hof "},
+            {"name": "Sportheim", "lat": 50.3167, "lon": 11.9167},
+            {"name": ""},
+            None,
+        ]
+        expected = [LocationNormalizer(base_path).normalize(dict(loc) if loc else loc) for loc in locations]
+        result = LocationNormalizer(base_path).normalize_batch(locations)
+        
+        for loc, got, want in zip(locations, result, expected):
+            mark = "✓" if got == want else "✗"
+            print(f"  {mark} {loc} → {got}")
+    
+    assert result == expected
+    return result == expected
+
+
 def test_no_silent_defaults():
     """Test that no coordinates are assigned without flagging for review."""
     print("\n" + "="*60)
@@ -392,12 +461,14 @@ def main():
     print("═"*60)
     
     tests = [
+        ("CoordinateExtractor - Iframe Coordinates", test_coordinate_extractor_from_iframe),
         ("CityDetector - Text Extraction", test_city_detector_from_text),
         ("CityDetector - Address Extraction", test_city_detector_from_address),
         ("CityDetector - Coordinate Reverse Geocoding", test_city_detector_from_coordinates),
         ("AmbiguousLocationHandler - Detection", test_ambiguous_location_detection),
         ("AmbiguousLocationHandler - Disambiguation", test_ambiguous_location_disambiguation),
         ("GeolocationResolver - Strategy Chain", test_geolocation_resolver),
+        ("LocationNormalizer - Batch Normalization", test_location_normalizer_batch),
         ("No Silent Defaults (CRITICAL)", test_no_silent_defaults),
     ]
     
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Tests for the processed-item cache of scraper sources."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.smart_scraper.source_cache import SourceCache
+
+
+class TestSourceCache(unittest.TestCase):
+    """Test recency order, trimming, and persistence."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_path = Path(self.tmpdir.name) / 'cache' / 'posts.json'
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_least_recently_seen_dropped(self):
+        """Test a full cache drops the key seen longest ago."""
+        cache = SourceCache(self.cache_path, max_entries=3)
+        for key in ('c', 'a', 'b'):
+            cache.mark_processed(key)
+        self.assertTrue(cache.is_processed('c'))
+        cache.mark_processed('d')
+        self.assertEqual(list(cache.processed_keys), ['b', 'c', 'd'])
+        self.assertFalse(cache.is_processed('a'))
+
+    def test_save_and_load_keep_order(self):
+        """Test keys are persisted and reloaded in recency order."""
+        cache = SourceCache(self.cache_path)
+        for key in ('z', 'x', 'y'):
+            cache.mark_processed(key)
+        cache.save()
+
+        loaded = SourceCache(self.cache_path)
+        loaded.load()
+        self.assertEqual(list(loaded.processed_keys), ['z', 'x', 'y'])
+
+    def test_load_missing_file(self):
+        """Test a missing cache file leaves the cache empty."""
+        cache = SourceCache(self.cache_path)
+        cache.load()
+        self.assertFalse(cache.is_processed('z'))
+
+
+if __name__ == '__main__':
+    unittest.main()
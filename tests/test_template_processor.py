@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Tests for the placeholder template processor."""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from modules.template_processor import TemplateProcessor, create_build_context
+
+
+class TestProcessTemplate(unittest.TestCase):
+    """Test placeholder and conditional rendering."""
+
+    def setUp(self):
+        self.processor = TemplateProcessor(Path('.'))
+
+    def test_placeholders(self):
+        """Test placeholders are replaced and missing ones become empty."""
+        result = self.processor.process_template(
+            '{{name}} v{{version}} {{debug}}{{missing}}', {'name': 'KRWL', 'version': 2, 'debug': True}
+        )
+        self.assertEqual(result, 'KRWL v2 true')
+
+    def test_conditionals(self):
+        """Test conditional blocks follow truthiness of their variable."""
+        template = '{{IF pwa_enabled}}pwa{{ENDIF}}|{{IF debug}}debug{{ENDIF}}|{{IF mode}}m{{ENDIF}}'
+        context = {'pwa_enabled': True, 'debug': False, 'mode': 'false'}
+        self.assertEqual(self.processor.process_template(template, context), 'pwa||')
+
+    def test_repeated_conditionals(self):
+        """Test each block is resolved on its own."""
+        template = '{{IF a}}1{{ENDIF}}{{IF b}}2{{ENDIF}}{{IF a}}3{{ENDIF}}'
+        self.assertEqual(self.processor.process_template(template, {'a': True}), '13')
+
+    def test_build_context(self):
+        """Test the build context drives mode-specific blocks."""
+        template = '{{IF icon_mode_svg}}svg{{ENDIF}}{{IF icon_mode_base64}}b64{{ENDIF}}'
+        context = create_build_context(icon_mode='base64')
+        self.assertEqual(self.processor.process_template(template, context), 'b64')
+
+
+class TestTemplateInspection(unittest.TestCase):
+    """Test placeholder extraction and validation."""
+
+    def setUp(self):
+        self.processor = TemplateProcessor(Path('.'))
+
+    def test_extract_placeholders(self):
+        """Test placeholders are sorted and unique."""
+        template = '{{b}}{{IF a}}{{b}}{{ENDIF}}'
+        self.assertEqual(self.processor.extract_placeholders(template), ['ENDIF', 'a', 'b'])
+
+    def test_validate_unbalanced(self):
+        """Test unbalanced conditionals are reported."""
+        is_valid, errors = self.processor.validate_template('{{IF a}}x')
+        self.assertFalse(is_valid)
+        self.assertIn('Unbalanced IF/ENDIF', errors[0])
+
+
+if __name__ == '__main__':
+    unittest.main()